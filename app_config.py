@@ -4,6 +4,7 @@ import json
 # Configuration constants
 DB_FILE = "stl_catalog.db"
 SETTINGS_FILE = "stl_catalog_settings.json"
+GEOMETRY_FILE = "stl_catalog_geometry.txt"
 DEFAULT_TAGS = ["FDM", "Resin"]
 
 def get_script_dir():
@@ -187,6 +187,7 @@ class BulkImportApp:
 
     def import_worker(self):
         total = len(self.folders_data)
+        imported = 0
         for i, (path, stls, name) in enumerate(self.folders_data):
             if not self.processing:
                 break
@@ -199,9 +200,10 @@ class BulkImportApp:
                     continue
                 others = [s for s in stls if s != main]
             result = DatabaseManager.add_or_update_file_with_related(None, main, others, name, self.global_tags)
+            imported += bool(result)
             self.queue.put(("log", f"{name}: {'Imported' if result else 'Failed'}"))
             self.queue.put(("progress", ((i + 1) / total) * 100))
-        self.queue.put(("log", "Import complete."))
+        self.queue.put(("log", f"Import complete. Added {imported} of {total} folders."))
         self.processing = False
 
     def check_queue(self):
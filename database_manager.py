@@ -3,9 +3,28 @@ import json
 import os
 from app_config import DB_FILE, DEFAULT_TAGS
 
+# Use orjson for catalog import/export if available (much faster on large catalogs)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 class DatabaseManager:
     """Class to handle all database operations"""
     
+    # Incremented on every write so callers can tell when cached data is stale
+    _data_version = 0
+    
+    @staticmethod
+    def get_data_version():
+        """Get a counter that changes whenever the catalog is written
+        
+        Returns:
+            int: Current data version
+        """
+        return DatabaseManager._data_version
+    
     @staticmethod
     def get_tag_usage_count(tag_name):
         """Get the number of files using a specific tag
@@ -41,6 +60,33 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    @staticmethod
+    def collect_tag_usage_counts():
+        """Get the number of files using each tag
+        
+        Returns:
+            dict: Tag name -> number of files using that tag
+        """
+        conn = sqlite3.connect(DB_FILE)
+        cursor = conn.cursor()
+        
+        try:
+            # Count files for every tag in one aggregate query
+            cursor.execute('''
+            SELECT t.name, COUNT(ft.file_id)
+            FROM tags t
+            LEFT JOIN file_tags ft ON t.id = ft.tag_id
+            GROUP BY t.id
+            ''')
+            
+            return {name: count for name, count in cursor.fetchall()}
+            
+        except sqlite3.Error as e:
+            print(f"Database Error: {e}")
+            return {}
+        finally:
+            conn.close()
+
     @staticmethod
     def update_tag(old_name, new_name):
         """Update a tag name
@@ -143,6 +189,7 @@ class DatabaseManager:
             
             # Commit the transaction
             conn.commit()
+            DatabaseManager._data_version += 1
             return True
             
         except sqlite3.Error as e:
@@ -189,6 +236,7 @@ class DatabaseManager:
             
             # Commit the transaction
             conn.commit()
+            DatabaseManager._data_version += 1
             return True
             
         except sqlite3.Error as e:
@@ -348,6 +396,7 @@ class DatabaseManager:
             
             # Commit the transaction
             conn.commit()
+            DatabaseManager._data_version += 1
             return True
             
         except sqlite3.Error as e:
@@ -423,48 +472,65 @@ class DatabaseManager:
         cursor.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,))
         
         conn.commit()
+        DatabaseManager._data_version += 1
         conn.close()
         return True
     
     @staticmethod
-    def get_filtered_files(search_term=""):
-        """Get filtered list of files based on search term"""
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
+    def list_files(search_term="", limit=200, after=None):
+        """Get one page of files matching the search term, ordered by name
+        
+        Pages are keyset-paginated on (name, id), so fetching a page costs the
+        same however far into the catalog it is.
         
-        results = {}
+        Args:
+            search_term: Text to match against file names and tags
+            limit: Maximum number of rows to return
+            after: (name, id) of the last row of the previous page, or None for the first page
+            
+        Returns:
+            list: (file_id, name) tuples
+        """
+        joins = ""
+        conditions = []
+        params = []
         
         if search_term:
             # Search by name or tags
-            cursor.execute('''
-            SELECT DISTINCT f.id, f.name, f.file_path
-            FROM stl_files f
+            joins = '''
             LEFT JOIN file_tags ft ON f.id = ft.file_id
             LEFT JOIN tags t ON ft.tag_id = t.id
-            WHERE LOWER(f.name) LIKE ? OR LOWER(t.name) LIKE ?
-            ORDER BY f.name
-            ''', (f'%{search_term.lower()}%', f'%{search_term.lower()}%'))
-        else:
-            # Get all files
-            cursor.execute('''
-            SELECT id, name, file_path FROM stl_files ORDER BY name
-            ''')
+            '''
+            conditions.append("(LOWER(f.name) LIKE ? OR LOWER(t.name) LIKE ?)")
+            params.extend([f'%{search_term.lower()}%', f'%{search_term.lower()}%'])
         
-        index = 0
-        for row in cursor.fetchall():
-            file_id = row[0]
-            name = row[1]
-            file_path = row[2]
-            
-            results[index] = {
-                'id': file_id,
-                'name': name,
-                'path': file_path
-            }
-            index += 1
+        if after is not None:
+            # Continue after the last row of the previous page
+            after_name, after_id = after
+            conditions.append("(f.name > ? OR (f.name = ? AND f.id > ?))")
+            params.extend([after_name, after_name, after_id])
         
-        conn.close()
-        return results
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+        
+        conn = sqlite3.connect(DB_FILE)
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f'''
+            SELECT DISTINCT f.id, f.name
+            FROM stl_files f
+            {joins}
+            {where}
+            ORDER BY f.name, f.id
+            LIMIT ?
+            ''', params)
+            return cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Database Error: {e}")
+            return []
+        finally:
+            conn.close()
     
     @staticmethod
     def get_file_details(file_id):
@@ -545,6 +611,7 @@ class DatabaseManager:
             
             # Commit the transaction
             conn.commit()
+            DatabaseManager._data_version += 1
             return True
             
         except sqlite3.Error as e:
@@ -578,6 +645,7 @@ class DatabaseManager:
             
             # Commit the transaction
             conn.commit()
+            DatabaseManager._data_version += 1
             return True
             
         except sqlite3.Error as e:
@@ -618,9 +686,13 @@ class DatabaseManager:
             
             conn.close()
             
-            # Write to JSON file
-            with open(export_path, 'w') as f:
-                json.dump(export_data, f, indent=4)
+            # Write to JSON file, formatted the same (2-space indent, UTF-8) either way
+            if ORJSON_AVAILABLE:
+                with open(export_path, 'wb') as f:
+                    f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(export_path, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
                 
             return True
             
@@ -632,9 +704,13 @@ class DatabaseManager:
     def import_from_json(import_path, replace=False):
         """Import data from a JSON file"""
         try:
-            # Load JSON data
-            with open(import_path, 'r') as f:
-                import_data = json.load(f)
+            # Load JSON data (orjson's decode errors subclass json.JSONDecodeError)
+            if ORJSON_AVAILABLE:
+                with open(import_path, 'rb') as f:
+                    import_data = orjson.loads(f.read())
+            else:
+                with open(import_path, 'r', encoding='utf-8') as f:
+                    import_data = json.load(f)
                 
             if not import_data:
                 return False
@@ -654,39 +730,43 @@ class DatabaseManager:
                     cursor.execute("DELETE FROM tags WHERE name NOT IN (?, ?)", 
                                   (DEFAULT_TAGS[0], DEFAULT_TAGS[1]))
                 
-                # Import each file
-                for file_path, data in import_data.items():
-                    # Insert file
-                    cursor.execute(
-                        "INSERT OR REPLACE INTO stl_files (file_path, name) VALUES (?, ?)",
-                        (file_path, data['name'])
+                # Insert all files
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO stl_files (file_path, name) VALUES (?, ?)",
+                    ((file_path, data['name']) for file_path, data in import_data.items())
+                )
+                
+                # Insert tags that don't exist yet
+                import_tags = {tag for data in import_data.values() for tag in data.get('tags', [])}
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO tags (name) VALUES (?)",
+                    ((tag,) for tag in import_tags)
+                )
+                
+                # Look up all file and tag ids at once
+                file_ids = dict(cursor.execute("SELECT file_path, id FROM stl_files"))
+                tag_ids = dict(cursor.execute("SELECT name, id FROM tags"))
+                
+                # If merging, remove existing tag relationships for the imported files
+                if not replace:
+                    cursor.executemany(
+                        "DELETE FROM file_tags WHERE file_id = ?",
+                        ((file_ids[file_path],) for file_path in import_data)
                     )
-                    
-                    # Get file_id
-                    cursor.execute("SELECT id FROM stl_files WHERE file_path = ?", (file_path,))
-                    file_id = cursor.fetchone()[0]
-                    
-                    # If merging, remove existing tag relationships for this file
-                    if not replace:
-                        cursor.execute("DELETE FROM file_tags WHERE file_id = ?", (file_id,))
-                    
-                    # Process tags
-                    for tag in data.get('tags', []):
-                        # Insert tag if it doesn't exist
-                        cursor.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag,))
-                        
-                        # Get tag_id
-                        cursor.execute("SELECT id FROM tags WHERE name = ?", (tag,))
-                        tag_id = cursor.fetchone()[0]
-                        
-                        # Create relationship between file and tag
-                        cursor.execute(
-                            "INSERT OR IGNORE INTO file_tags (file_id, tag_id) VALUES (?, ?)",
-                            (file_id, tag_id)
-                        )
+                
+                # Create relationships between files and tags
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO file_tags (file_id, tag_id) VALUES (?, ?)",
+                    (
+                        (file_ids[file_path], tag_ids[tag])
+                        for file_path, data in import_data.items()
+                        for tag in data.get('tags', [])
+                    )
+                )
                 
                 # Commit the transaction
                 conn.commit()
+                DatabaseManager._data_version += 1
                 return True
                 
             except sqlite3.Error as e:
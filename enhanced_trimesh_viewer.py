@@ -14,6 +14,9 @@ import time
 import json
 import multiprocessing
 import argparse
+import queue
+
+from utils.viewer_process import read_viewer_paths
 
 try:
     import trimesh
@@ -78,15 +81,6 @@ class EnhancedSTLViewer:
             
         self.apply_loaded_settings_to_ui()
 
-        # Check if any existing viewer processes should be terminated
-        if hasattr(multiprocessing, 'active_children'):
-            for proc in multiprocessing.active_children():
-                if proc.name.startswith('TrimeshViewer'):
-                    try:
-                        proc.terminate()
-                    except:
-                        pass
-
     def create_ui(self):
         self.main_paned = ttk.PanedWindow(self.master, orient=tk.HORIZONTAL)
         self.main_paned.pack(fill=tk.BOTH, expand=True)
@@ -625,13 +619,65 @@ def show_mesh_in_process(stl_file, settings):
     except Exception as e:
         print(f"Error in viewer process: {e}")
 
+def run_interactive(master):
+    """
+    Open a viewer window for each STL path sent on stdin
+    
+    Every file gets its own Toplevel on the shared master, so a new file opens
+    straight away while earlier windows stay open.
+    
+    Args:
+        master: Hidden Tk root that owns the viewer windows
+    """
+    paths = queue.Queue()
+    threading.Thread(target=read_viewer_paths, args=(paths,), daemon=True).start()
+    
+    def open_queued():
+        try:
+            while True:
+                stl_file = paths.get_nowait()
+                if stl_file is None:
+                    # The catalog has closed; keep the open viewers until they are closed
+                    wait_for_windows()
+                    return
+                EnhancedSTLViewer(master=master, stl_file=stl_file)
+        except queue.Empty:
+            master.after(100, open_queued)
+    
+    def wait_for_windows():
+        if master.winfo_children():
+            master.after(500, wait_for_windows)
+        else:
+            master.destroy()
+    
+    master.after(100, open_queued)
+    master.mainloop()
+
 def main():
     """Main entry point for the application"""
     parser = argparse.ArgumentParser(description="Enhanced STL Viewer")
     parser.add_argument('stl_file', nargs='?', help='STL file to view')
     parser.add_argument('--parent-id', help='ID of parent window', dest='parent_id')
+    parser.add_argument('--interactive', action='store_true',
+                        help='Read STL file paths from stdin, one per line, and view each in turn')
     args = parser.parse_args()
     
+    # With a parent window, viewers are Toplevels of a hidden root rather than
+    # being the root themselves
+    master = None
+    if args.parent_id or args.interactive:
+        try:
+            root = tk.Tk()
+            root.withdraw()
+            master = root
+        except:
+            master = None
+    
+    if args.interactive and master is not None:
+        # Stay alive and open a viewer for each path the parent process sends us
+        run_interactive(master)
+        return
+    
     # Get STL file path
     stl_file = args.stl_file
     if not stl_file:
@@ -644,16 +690,6 @@ def main():
             return
 
     # Create and run the viewer
-    master = None
-    if args.parent_id:
-        try:
-            # Try to create a Toplevel with an existing window as parent
-            root = tk.Tk()
-            root.withdraw()
-            master = root
-        except:
-            master = None
-    
     viewer = EnhancedSTLViewer(master=master, stl_file=stl_file)
     viewer.run()
 
@@ -13,6 +13,8 @@ import platform
 import time
 import ctypes
 import threading
+import functools
+import queue
 
 try:
     import trimesh
@@ -23,6 +25,8 @@ except ImportError:
     print("Please install it with: pip install trimesh pyglet<2")
     sys.exit(1)
 
+from utils.viewer_process import read_viewer_paths
+
 def find_window_handle_by_partial_title(partial_title):
     from ctypes import wintypes
 
@@ -66,22 +70,32 @@ def maximize_window(partial_title, timeout=5.0, check_interval=0.1):
     print(f"Warning: Could not find window with title containing '{partial_title}' to maximize.")
     return False
 
+@functools.lru_cache(maxsize=1)
 def get_screen_size():
-    display = pyglet.canvas.get_display()
-    screen = display.get_default_screen()
-    return screen.width, screen.height
+    try:
+        display = pyglet.canvas.get_display()
+        screen = display.get_default_screen()
+        return screen.width, screen.height
+    except Exception:
+        # No usable display (e.g. headless); fall back to a sensible size
+        return 1024, 768
 
-def view_stl_file(stl_file, settings=None):
+def view_stl_file(stl_file, settings=None, start_loop=True):
     """
     View an STL file with the specified settings
     
     Args:
         stl_file: Path to the STL file
         settings: Dictionary of viewer settings
+        start_loop: Run the event loop until the window is closed; when False the
+            window is only opened and the caller runs pyglet.app.run()
+        
+    Returns:
+        bool: True if a viewer window was opened, False otherwise
     """
     if not os.path.exists(stl_file):
         print(f"Error: File not found: {stl_file}")
-        return
+        return False
     
     # Default settings
     default_settings = {
@@ -104,7 +118,8 @@ def view_stl_file(stl_file, settings=None):
         # Load the STL file
         if not settings.get('direct_render', False):
             print(f"Loading STL file: {stl_file}")
-        mesh = trimesh.load(stl_file)
+        # Skip trimesh's vertex merging/validation; the viewer never edits topology
+        mesh = trimesh.load(stl_file, process=False, validate=False)
         
         # Create a copy for display
         display_mesh = mesh.copy()
@@ -189,23 +204,66 @@ def view_stl_file(stl_file, settings=None):
             background=bg[:3],
             resolution=window_size,
             window_title=window_title,
-            smooth=True
+            smooth=True,
+            start_loop=start_loop
         )
         
-        if not settings.get('direct_render', False):
+        if start_loop and not settings.get('direct_render', False):
             print("Viewer closed")
+        return True
         
     except Exception as e:
         print(f"Error viewing STL file: {e}")
+        return False
+
+def run_interactive(settings=None):
+    """
+    Open a viewer window for each STL path sent on stdin
+    
+    Paths arriving while windows are open get a window of their own straight
+    away. pyglet's loop ends when the last window closes, after which the next
+    path starts it again.
+    
+    Args:
+        settings: Dictionary of viewer settings
+    """
+    paths = queue.Queue()
+    threading.Thread(target=read_viewer_paths, args=(paths,), daemon=True).start()
+    
+    def open_queued(dt):
+        while True:
+            try:
+                stl_file = paths.get_nowait()
+            except queue.Empty:
+                return
+            if stl_file is None:
+                # Leave the end of input for the outer loop once the windows close
+                paths.put(None)
+                return
+            view_stl_file(stl_file, settings, start_loop=False)
+    
+    pyglet.clock.schedule_interval(open_queued, 0.1)
+    
+    while True:
+        stl_file = paths.get()
+        if stl_file is None:
+            return
+        if view_stl_file(stl_file, settings, start_loop=False):
+            pyglet.app.run()
 
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='Standalone STL Viewer')
-    parser.add_argument('stl_file', help='Path to the STL file to view')
+    parser.add_argument('stl_file', nargs='?', help='Path to the STL file to view')
     parser.add_argument('settings', nargs='?', help='Settings as JSON string')
+    parser.add_argument('--interactive', action='store_true',
+                        help='Read STL file paths from stdin, one per line, and view each in turn')
     
     args = parser.parse_args()
     
+    if not args.interactive and not args.stl_file:
+        parser.error("an STL file is required unless --interactive is given")
+    
     # Parse settings if provided
     settings = None
     if args.settings:
@@ -214,6 +272,11 @@ def main():
         except json.JSONDecodeError:
             print("Warning: Invalid settings JSON, using defaults")
     
+    if args.interactive:
+        # Stay alive and view each path the parent process sends us
+        run_interactive(settings)
+        return
+    
     # View the STL file
     view_stl_file(args.stl_file, settings)
 
@@ -8,6 +8,8 @@ from tkinter import messagebox
 import subprocess
 import importlib.util
 
+from utils.viewer_process import send_to_viewer_process
+
 def check_trimesh_available():
     """Check if Trimesh is available"""
     try:
@@ -54,6 +56,29 @@ def install_dependencies():
         )
         return False
 
+def send_to_standalone_viewer(file_path):
+    """Show an STL file in the shared standalone viewer process, starting it if needed
+    
+    Reusing one process avoids paying the interpreter and Trimesh import
+    cost on every view.
+    
+    Args:
+        file_path: Path to the STL file
+        
+    Returns:
+        bool: True if the path was handed to the viewer, False otherwise
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    viewer_script = os.path.join(script_dir, "enhanced_trimesh_viewer_standalone.py")
+    if not os.path.exists(viewer_script):
+        return False
+    
+    try:
+        send_to_viewer_process([sys.executable, viewer_script, "--interactive"], file_path)
+        return True
+    except OSError:
+        return False
+
 def view_stl(parent, file_path):
     """View an STL file using the enhanced Trimesh viewer"""
     if not os.path.exists(file_path):
@@ -120,7 +145,11 @@ def view_stl(parent, file_path):
                 viewer = viewer_module.EnhancedSTLViewer(parent, file_path)
                 return
         
-        # If we couldn't import the module, launch it as a subprocess
+        # If we couldn't import the module, hand the file to the shared viewer process
+        if not viewer_module_spec and send_to_standalone_viewer(file_path):
+            return
+        
+        # Otherwise launch the full viewer as a one-off subprocess
         if not viewer_module_spec:
             # Find the viewer script
             script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -179,8 +208,8 @@ def open_stl_file(file_path):
             print("Error: Could not find the enhanced_trimesh_viewer.py script")
             return False
         
-        # Launch the viewer as a subprocess
-        subprocess.Popen([sys.executable, viewer_script, file_path])
+        # Hand the file to the shared viewer process, which outlives this one
+        send_to_viewer_process([sys.executable, viewer_script, "--interactive"], file_path)
         return True
         
     except Exception as e:
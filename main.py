@@ -7,23 +7,44 @@ import os
 import sys
 import tkinter as tk
 import logging
+import logging.handlers
+import atexit
 
 from app_config import get_script_dir
-from ui.app import STLCatalogApp
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
 def setup_logging():
     """Configure logging for the application"""
+    # Buffer file records so routine INFO logging doesn't hit the disk per line;
+    # warnings and errors flush the buffer immediately
+    file_handler = logging.FileHandler("stl_catalog.log")
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    memory_handler = logging.handlers.MemoryHandler(
+        512,
+        flushLevel=logging.WARNING,
+        target=file_handler
+    )
+    atexit.register(memory_handler.flush)
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=LOG_FORMAT,
         handlers=[
-            logging.FileHandler("stl_catalog.log"),
+            memory_handler,
             logging.StreamHandler()
-        ]
+        ],
+        force=True
     )
 
 def main():
     """Main entry point for the application"""
+    # A single STL argument only needs the viewer, not the catalog window
+    if len(sys.argv) == 2 and sys.argv[1].lower().endswith('.stl'):
+        from enhanced_viewer_integration import open_stl_file
+        open_stl_file(sys.argv[1])
+        return
+    
     # Set up logging
     setup_logging()
     
@@ -33,6 +54,8 @@ def main():
     
     logging.info("Starting STL Catalog application")
     
+    from ui.app import STLCatalogApp
+    
     try:
         # Create the main window
         root = tk.Tk()
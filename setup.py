@@ -6,9 +6,38 @@ import os
 import sys
 import subprocess
 import platform
+import asyncio
+import multiprocessing
+import codecs
+import locale
+from importlib.metadata import version, PackageNotFoundError
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Pipe buffer size for pip subprocesses and the size of each read from it
+PIPE_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 65536
+
+# How long log output is buffered before being written to the output widget
+LOG_FLUSH_INTERVAL_MS = 50
+
+# Maximum number of lines kept in the output widget
+MAX_OUTPUT_LINES = 2000
+
+# How often the asyncio loop is polled while pip commands are running
+EVENT_LOOP_POLL_MS = 20
+
+def _show_test_box():
+    """Open the test mesh in a viewer (runs in a child process)"""
+    import trimesh
+    trimesh.creation.box(extents=[1, 1, 1]).show()
+
 class TrimeshSetupUtility:
     def __init__(self, root):
         self.root = root
@@ -18,6 +47,15 @@ class TrimeshSetupUtility:
         self.root.geometry("800x700")
         self.root.minsize(800, 700)
         
+        # Pending output lines, flushed to the text widget periodically
+        self._log_buf = []
+        self._flush_scheduled = False
+        
+        # Event loop for pip subprocesses, pumped from Tk while tasks are pending.
+        # uvloop drains subprocess pipes faster than the default loop where available.
+        self._loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+        self._pumping = False
+        
         # Force the window to be drawn and updated
         self.root.update_idletasks()
         
@@ -69,18 +107,17 @@ class TrimeshSetupUtility:
         )
         platform_label.place(relx=0.05, rely=0.35, relwidth=0.90)
         
-        # Check Trimesh and Pyglet status
-        trimesh_status, pyglet_status = self.check_dependencies_status()
+        # Trimesh and Pyglet status is filled in once the window has been drawn
         self.trimesh_status_label = ttk.Label(
             info_frame,
-            text=f"Trimesh Status: {trimesh_status}",
+            text="Trimesh Status: Checking…",
             font=("Arial", 10)
         )
         self.trimesh_status_label.place(relx=0.05, rely=0.55, relwidth=0.90)
         
         self.pyglet_status_label = ttk.Label(
             info_frame,
-            text=f"Pyglet Status: {pyglet_status}",
+            text="Pyglet Status: Checking…",
             font=("Arial", 10)
         )
         self.pyglet_status_label.place(relx=0.05, rely=0.75, relwidth=0.90)
@@ -160,31 +197,36 @@ class TrimeshSetupUtility:
         )
         test_button.place(relx=0.30, rely=0.75, relwidth=0.40, relheight=0.12)
         
+        # Buttons that run pip, disabled while a pip run is in progress
+        self._pip_buttons = (standard_button, fix_button, uninstall_button)
+        
         # Initialize with a welcome message
         self.log("Trimesh Setup Utility ready. Select an installation option to begin.")
+        
+        # Check dependencies after the first paint
+        self.root.after(50, self.update_status)
     
     def check_dependencies_status(self):
         """Check the status of Trimesh and Pyglet"""
         trimesh_status = "Not installed"
         pyglet_status = "Not installed"
         
+        # Read versions from package metadata rather than importing the (heavy) packages
         try:
-            import trimesh
-            trimesh_version = trimesh.__version__
+            trimesh_version = version("trimesh")
             trimesh_status = f"Installed (version {trimesh_version})"
-        except ImportError:
+        except PackageNotFoundError:
             pass
         
         try:
-            import pyglet
-            pyglet_version = pyglet.version
+            pyglet_version = version("pyglet")
             pyglet_status = f"Installed (version {pyglet_version})"
             
             # Check if pyglet version is < 2
             major_version = int(pyglet_version.split('.')[0])
             if major_version >= 2:
                 pyglet_status += " - WARNING: Version must be < 2.0 for Trimesh visualization"
-        except ImportError:
+        except PackageNotFoundError:
             pass
         
         return trimesh_status, pyglet_status
@@ -196,31 +238,115 @@ class TrimeshSetupUtility:
         self.pyglet_status_label.config(text=f"Pyglet Status: {pyglet_status}")
     
     def log(self, message):
-        """Add message to the output text widget"""
+        """Queue a message for the output text widget"""
+        self._log_buf.append(message)
+        
+        # Coalesce bursts of output into a single widget update
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued messages to the output text widget in one insert"""
+        self._flush_scheduled = False
+        if not self._log_buf:
+            return
+        
+        # Only follow new output if the user hasn't scrolled up to read earlier lines
+        at_bottom = self.output_text.yview()[1] >= 1.0
+        
         self.output_text.config(state=tk.NORMAL)
-        self.output_text.insert(tk.END, message + "\n")
-        self.output_text.see(tk.END)
+        self.output_text.insert(tk.END, "\n".join(self._log_buf) + "\n")
+        
+        # Drop the oldest lines so the widget never grows without bound
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > MAX_OUTPUT_LINES:
+            self.output_text.delete("1.0", f"{line_count - MAX_OUTPUT_LINES}.0")
+        
         self.output_text.config(state=tk.DISABLED)
-        self.root.update_idletasks()
+        self._log_buf.clear()
+        
+        if at_bottom:
+            self.root.after_idle(self.output_text.see, tk.END)
+    
+    def run_in_background(self, coro_func):
+        """Start a pip coroutine on the asyncio loop driven from the Tk event loop
+        
+        Only one pip run may touch site-packages at a time, so the request is
+        ignored while another is in progress.
+        """
+        if self._pumping:
+            return
+        
+        self._set_pip_buttons_state(tk.DISABLED)
+        self._loop.create_task(coro_func())
+        self._pumping = True
+        self.root.after(0, self._pump_event_loop)
     
-    def run_subprocess(self, cmd, success_msg, error_msg):
+    def _set_pip_buttons_state(self, state):
+        """Enable or disable the buttons that run pip"""
+        for button in self._pip_buttons:
+            button.config(state=state)
+    
+    def _pump_event_loop(self):
+        """Run one non-blocking pass of the asyncio loop, then hand control back to Tk
+        
+        Each pass polls the subprocess pipes with a zero timeout, so the UI never
+        waits on pip output.
+        """
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        
+        if asyncio.all_tasks(self._loop):
+            self.root.after(EVENT_LOOP_POLL_MS, self._pump_event_loop)
+        else:
+            self._pumping = False
+            self._set_pip_buttons_state(tk.NORMAL)
+    
+    async def run_subprocess(self, cmd, success_msg, error_msg):
         """Run a subprocess command and handle output and errors"""
         self.log(f"Running: {' '.join(cmd)}")
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+            # A large pipe lets pip write ahead without blocking on us
+            # (uvloop creates its own pipes and doesn't accept this option)
+            popen_kwargs = {}
+            if sys.version_info >= (3, 10) and not UVLOOP_AVAILABLE:
+                popen_kwargs["pipesize"] = PIPE_SIZE
+            
+            # Don't open a console window for pip on Windows
+            if platform.system() == "Windows":
+                startupinfo = subprocess.STARTUPINFO()
+                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+                startupinfo.wShowWindow = subprocess.SW_HIDE
+                popen_kwargs["startupinfo"] = startupinfo
+                popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+            
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                limit=READ_CHUNK_SIZE,
+                **popen_kwargs
             )
             
-            # Read and display output line by line
-            for line in process.stdout:
-                self.log(line.strip())
+            # Read output in large chunks and log each chunk's complete lines at once
+            decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+            pending = ""
+            while True:
+                chunk = await process.stdout.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                lines = (pending + decoder.decode(chunk)).split("\n")
+                pending = lines.pop()
+                if lines:
+                    self.log("\n".join(line.strip() for line in lines))
+            
+            pending += decoder.decode(b"", final=True)
+            if pending.strip():
+                self.log(pending.strip())
             
             # Wait for process to complete
-            process.wait()
+            await process.wait()
             
             if process.returncode == 0:
                 self.log(success_msg)
@@ -234,11 +360,14 @@ class TrimeshSetupUtility:
     
     def install_standard(self):
         """Install Trimesh with visualization support"""
+        self.run_in_background(self._install_standard)
+    
+    async def _install_standard(self):
         self.log("Installing Trimesh with visualization support...")
         
         # First, make sure pyglet is installed with correct version (must be < 2)
         self.log("Step 1/2: Installing pyglet<2")
-        result1 = self.run_subprocess(
+        result1 = await self.run_subprocess(
             [sys.executable, "-m", "pip", "install", "pyglet<2"],
             "Pyglet < 2.0 installed successfully.",
             "Failed to install Pyglet."
@@ -246,12 +375,12 @@ class TrimeshSetupUtility:
         
         if not result1:
             self.log("Failed to install Pyglet. Aborting Trimesh installation.")
-            self.update_status()
+            self.root.after(0, self.update_status)
             return
         
         # Then install Trimesh
         self.log("Step 2/2: Installing Trimesh")
-        result2 = self.run_subprocess(
+        result2 = await self.run_subprocess(
             [sys.executable, "-m", "pip", "install", "trimesh[easy]"],
             "Trimesh installed successfully with visualization support.",
             "Failed to install Trimesh."
@@ -262,15 +391,18 @@ class TrimeshSetupUtility:
         else:
             self.log("Trimesh installation failed, but Pyglet was installed successfully.")
         
-        self.update_status()
+        self.root.after(0, self.update_status)
     
     def fix_pyglet(self):
         """Fix Pyglet version (must be < 2)"""
+        self.run_in_background(self._fix_pyglet)
+    
+    async def _fix_pyglet(self):
         self.log("Fixing Pyglet version (installing version < 2.0)...")
         
-        # First uninstall current pyglet
+        # The uninstall must finish before the install starts, so these stay sequential
         self.log("Step 1/2: Removing existing Pyglet installation")
-        self.run_subprocess(
+        await self.run_subprocess(
             [sys.executable, "-m", "pip", "uninstall", "-y", "pyglet"],
             "Removed existing Pyglet installation.",
             "Failed to remove existing Pyglet or Pyglet not installed."
@@ -278,7 +410,7 @@ class TrimeshSetupUtility:
         
         # Install correct version
         self.log("Step 2/2: Installing Pyglet < 2.0")
-        result = self.run_subprocess(
+        result = await self.run_subprocess(
             [sys.executable, "-m", "pip", "install", "pyglet<2"],
             "Pyglet < 2.0 installed successfully.",
             "Failed to install Pyglet < 2.0."
@@ -289,30 +421,43 @@ class TrimeshSetupUtility:
         else:
             self.log("Failed to fix Pyglet. Trimesh visualization may not work correctly.")
         
-        self.update_status()
+        self.root.after(0, self.update_status)
     
     def uninstall_trimesh(self):
         """Uninstall Trimesh"""
         if messagebox.askyesno("Confirm Uninstall", "Are you sure you want to uninstall Trimesh?"):
-            self.log("Uninstalling Trimesh...")
-            result = self.run_subprocess(
-                [sys.executable, "-m", "pip", "uninstall", "-y", "trimesh"],
-                "Trimesh uninstalled successfully.",
-                "Failed to uninstall Trimesh."
-            )
-            
-            if result:
-                # Ask if pyglet should also be uninstalled
-                if messagebox.askyesno("Uninstall Dependencies", "Do you also want to uninstall Pyglet?"):
-                    self.log("Uninstalling Pyglet...")
-                    self.run_subprocess(
-                        [sys.executable, "-m", "pip", "uninstall", "-y", "pyglet"],
-                        "Pyglet uninstalled successfully.",
-                        "Failed to uninstall Pyglet."
-                    )
-            
+            self.run_in_background(self._uninstall_trimesh)
+    
+    async def _uninstall_trimesh(self):
+        self.log("Uninstalling Trimesh...")
+        result = await self.run_subprocess(
+            [sys.executable, "-m", "pip", "uninstall", "-y", "trimesh"],
+            "Trimesh uninstalled successfully.",
+            "Failed to uninstall Trimesh."
+        )
+        
+        if result:
+            # Show the dialog outside the asyncio pump
+            self.root.after(0, self.ask_uninstall_pyglet)
+        else:
+            self.root.after(0, self.update_status)
+    
+    def ask_uninstall_pyglet(self):
+        """Ask if pyglet should also be uninstalled"""
+        if messagebox.askyesno("Uninstall Dependencies", "Do you also want to uninstall Pyglet?"):
+            self.run_in_background(self._uninstall_pyglet)
+        else:
             self.update_status()
     
+    async def _uninstall_pyglet(self):
+        self.log("Uninstalling Pyglet...")
+        await self.run_subprocess(
+            [sys.executable, "-m", "pip", "uninstall", "-y", "pyglet"],
+            "Pyglet uninstalled successfully.",
+            "Failed to uninstall Pyglet."
+        )
+        self.root.after(0, self.update_status)
+    
     def test_trimesh(self):
         """Test if Trimesh is installed correctly with visualization support"""
         self.log("Testing Trimesh installation...")
@@ -335,18 +480,21 @@ class TrimeshSetupUtility:
             self.log("Creating test mesh...")
             mesh = trimesh.creation.box(extents=[1, 1, 1])
             
-            # Test some basic properties
-            self.log(f"Test mesh has {len(mesh.vertices)} vertices and {len(mesh.faces)} faces")
-            self.log(f"Mesh volume: {mesh.volume}")
-            self.log(f"Mesh surface area: {mesh.area}")
+            # Test some basic properties, reading each (possibly computed) property once
+            vertices = mesh.vertices
+            faces = mesh.faces
+            volume = mesh.volume
+            area = mesh.area
+            self.log(f"Test mesh has {vertices.shape[0]} vertices and {faces.shape[0]} faces")
+            self.log(f"Mesh volume: {volume}")
+            self.log(f"Mesh surface area: {area}")
             
             self.log("Trimesh test completed successfully!")
             
             # Ask if user wants to view the test mesh
             if messagebox.askyesno("View Test Mesh", "Would you like to open the test mesh in a viewer to verify visualization works?"):
-                # Use a separate thread to show the mesh
-                import threading
-                threading.Thread(target=lambda: mesh.show(), daemon=True).start()
+                # Show the mesh in its own process so pyglet's event loop doesn't compete with Tk
+                multiprocessing.Process(target=_show_test_box, daemon=False).start()
                 self.log("Opening test mesh in viewer. Close the viewer window when done.")
             
         except ImportError as e:
@@ -3,9 +3,11 @@ Tag Manager for STL Catalog application
 
 This module provides functionality to view, edit, and delete tags.
 """
+import bisect
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from app_config import DEFAULT_TAGS
 from database_manager import DatabaseManager
 
 class TagManager:
@@ -50,6 +52,13 @@ class TagManager:
         self.tags = DatabaseManager.collect_all_tags()
         # Sort tags alphabetically
         self.tags.sort()
+        self._tag_set = set(self.tags)
+        
+        # Fetch all usage counts up front so selecting a tag doesn't query the database
+        self._usage_counts = DatabaseManager.collect_tag_usage_counts()
+        
+        # Remember which database state these tags reflect
+        self._data_version = DatabaseManager.get_data_version()
     
     def create_ui(self):
         """Create the user interface"""
@@ -156,15 +165,47 @@ class TagManager:
     
     def update_tag_list(self):
         """Update the tag listbox with current tags"""
-        # Clear listbox
-        self.tag_listbox.delete(0, tk.END)
+        # Hide the listbox while repopulating so it isn't redrawn per row
+        self.tag_listbox.pack_forget()
+        try:
+            # Clear listbox
+            self.tag_listbox.delete(0, tk.END)
+            
+            # Refresh tag list from database only if it has changed since the last load
+            if DatabaseManager.get_data_version() != self._data_version:
+                self.load_tags()
+            
+            # Add all tags to listbox in a single call
+            if self.tags:
+                self.tag_listbox.insert(tk.END, *self.tags)
+        finally:
+            self.tag_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    
+    def insert_tag(self, tag_name):
+        """Insert a tag into the sorted tag list and the listbox
         
-        # Refresh tag list from database
-        self.load_tags()
+        Args:
+            tag_name: Name of the tag
+            
+        Returns:
+            int: Index at which the tag was inserted
+        """
+        index = bisect.bisect_left(self.tags, tag_name)
+        self.tags.insert(index, tag_name)
+        self._tag_set.add(tag_name)
+        self.tag_listbox.insert(index, tag_name)
+        return index
+    
+    def remove_tag(self, tag_name):
+        """Remove a tag from the tag list and the listbox
         
-        # Add tags to listbox
-        for tag in self.tags:
-            self.tag_listbox.insert(tk.END, tag)
+        Args:
+            tag_name: Name of the tag
+        """
+        index = self.tags.index(tag_name)
+        del self.tags[index]
+        self._tag_set.discard(tag_name)
+        self.tag_listbox.delete(index)
     
     def on_tag_select(self, event):
         """Handle tag selection in listbox"""
@@ -201,7 +242,9 @@ class TagManager:
         Returns:
             int: Number of files using this tag
         """
-        return DatabaseManager.get_tag_usage_count(tag_name)
+        if self._usage_counts is None:
+            self._usage_counts = DatabaseManager.collect_tag_usage_counts()
+        return self._usage_counts.get(tag_name, 0)
     
     def add_tag(self):
         """Add a new tag"""
@@ -212,24 +255,24 @@ class TagManager:
             return
         
         # Check if tag already exists
-        if tag_name in self.tags:
+        if tag_name in self._tag_set:
             messagebox.showerror("Error", f"Tag '{tag_name}' already exists")
             return
         
         # Add tag to database
         if DatabaseManager.add_tag(tag_name):
-            # Update UI
-            self.update_tag_list()
+            # Usage counts are stale after any tag change
+            self._usage_counts = None
+            
+            # Update UI in place rather than reloading every tag
+            index = self.insert_tag(tag_name)
+            self._data_version = DatabaseManager.get_data_version()
             
             # Select the new tag
-            try:
-                index = self.tags.index(tag_name)
-                self.tag_listbox.selection_clear(0, tk.END)
-                self.tag_listbox.selection_set(index)
-                self.tag_listbox.see(index)
-                self.on_tag_select(None)  # Trigger selection event
-            except ValueError:
-                pass
+            self.tag_listbox.selection_clear(0, tk.END)
+            self.tag_listbox.selection_set(index)
+            self.tag_listbox.see(index)
+            self.on_tag_select(None)  # Trigger selection event
             
             # Clear entry field
             self.tag_name_var.set("")
@@ -260,7 +303,7 @@ class TagManager:
             return
         
         # Check if new tag name already exists
-        if new_tag_name in self.tags and new_tag_name != old_tag_name:
+        if new_tag_name in self._tag_set and new_tag_name != old_tag_name:
             messagebox.showerror("Error", f"Tag '{new_tag_name}' already exists")
             return
         
@@ -270,11 +313,19 @@ class TagManager:
         
         # Update tag in database
         if DatabaseManager.update_tag(old_tag_name, new_tag_name):
+            # Usage counts are stale after any tag change
+            self._usage_counts = None
+            
             # Keep track of renamed tags
             self.renamed_tags[old_tag_name] = new_tag_name
             
-            # Update UI
-            self.update_tag_list()
+            # Update UI; default tags are recreated by the database, so reload for those
+            if old_tag_name in DEFAULT_TAGS:
+                self.update_tag_list()
+            else:
+                self.remove_tag(old_tag_name)
+                self.insert_tag(new_tag_name)
+                self._data_version = DatabaseManager.get_data_version()
             
             # Try to select the updated tag
             try:
@@ -319,8 +370,15 @@ class TagManager:
         
         # Delete tag from database
         if DatabaseManager.delete_tag(tag_name):
-            # Update UI
-            self.update_tag_list()
+            # Usage counts are stale after any tag change
+            self._usage_counts = None
+            
+            # Update UI; default tags are recreated by the database, so reload for those
+            if tag_name in DEFAULT_TAGS:
+                self.update_tag_list()
+            else:
+                self.remove_tag(tag_name)
+                self._data_version = DatabaseManager.get_data_version()
             
             # Clear entry field
             self.tag_name_var.set("")
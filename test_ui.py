@@ -2,8 +2,33 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk
 import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Pillow 9.1+ moved the resampling filters into Image.Resampling
+LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+# ttk styles are shared by every window, so they only need configuring once
+_styles_configured = False
+
+def configure_dark_styles(style):
+    """Configure the dark ttk styles once per process"""
+    global _styles_configured
+    if _styles_configured:
+        return
+
+    style.theme_use("clam")
+    style.configure("TFrame", background="#2e2e2e")
+    style.configure("TLabel", background="#2e2e2e", foreground="white", font=("Segoe UI", 10))
+    style.configure("TButton", background="#3c3f41", foreground="white", padding=6, font=("Segoe UI", 10))
+    style.map("TButton", background=[("active", "#5c5f61")])
+    _styles_configured = True
 
 class ModernSTLCatalogApp:
+    # Button icons keyed by (icon_path, size), shared by every button and window
+    _ICON_CACHE = {}
+
     def __init__(self, root):
         self.root = root
         self.script_dir = os.path.dirname(os.path.abspath(__file__))  # Get the directory this script is in
@@ -19,11 +44,7 @@ class ModernSTLCatalogApp:
 
     def set_dark_theme(self):
         self.root.configure(bg="#2e2e2e")
-        self.style.theme_use("clam")
-        self.style.configure("TFrame", background="#2e2e2e")
-        self.style.configure("TLabel", background="#2e2e2e", foreground="white", font=("Segoe UI", 10))
-        self.style.configure("TButton", background="#3c3f41", foreground="white", padding=6, font=("Segoe UI", 10))
-        self.style.map("TButton", background=[("active", "#5c5f61")])
+        configure_dark_styles(self.style)
 
     def create_widgets(self):
         # Top Bar
@@ -48,16 +69,23 @@ class ModernSTLCatalogApp:
     def add_button(self, parent, text, command):
         icon_filename = f"{text.lower().replace(' ', '_')}.png"
         icon_path = os.path.join(self.script_dir, "icons", icon_filename)
-        print(f"Looking for icon at: {icon_path}")
-
-        if os.path.exists(icon_path):
-            img = Image.open(icon_path)
-            img = img.resize((16, 16), Image.LANCZOS)
-            icon = ImageTk.PhotoImage(img)
+        logger.debug("Looking for icon at: %s", icon_path)
+
+        key = (icon_path, 16)
+        icon = self._ICON_CACHE.get(key)
+        if icon is None:
+            try:
+                img = Image.open(icon_path)
+            except OSError:
+                logger.debug("Icon not found: %s", icon_path)
+            else:
+                img.thumbnail((16, 16), LANCZOS)
+                icon = ImageTk.PhotoImage(img)
+                self._ICON_CACHE[key] = icon  # Keep reference
+
+        if icon is not None:
             btn = ttk.Button(parent, text=f" {text}", image=icon, compound=tk.LEFT, command=command)
-            btn.image = icon  # Keep reference
         else:
-            print(f"Icon not found: {icon_path}")
             btn = ttk.Button(parent, text=text, command=command)
 
         btn.pack(side=tk.LEFT, padx=5)
@@ -4,17 +4,24 @@ Main application class for STL Catalog
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkFont
 from tkinter.scrolledtext import ScrolledText
 import os
+import json
+import bisect
+import functools
+from collections import OrderedDict
 import customtkinter as ctk
 
 from app_config import DEFAULT_TAGS, load_settings, save_settings
 from database_manager import DatabaseManager
-from utils.geometry import apply_window_geometry, save_window_geometry
-from ui.settings_dialog import open_settings_dialog
+from utils.geometry import (
+    apply_window_geometry, install_geometry_saver, is_window_maximized, save_window_geometry
+)
+from ui.settings_dialog import SettingsDialog
 from ui.file_manager import (
     browse_stl_file, browse_stl_folder, add_file_to_catalog, update_file_in_catalog, 
-    delete_files_from_catalog, export_database, import_database
+    delete_files_from_catalog, export_database, import_database, run_in_background
 )
 from ui.viewer_integration import view_selected_stl
 from tag_manager import open_tag_manager
@@ -22,6 +29,21 @@ from tag_manager import open_tag_manager
 ctk.set_appearance_mode("System") # Modes: "System" (uses OS setting), "Dark", "Light"
 ctk.set_default_color_theme("blue") # Themes: "blue" (default), "dark-blue", "green"
 
+# Delay after the last keystroke before the catalog search runs
+SEARCH_DEBOUNCE_MS = 200
+
+# Delay after the last edit of the file path before it is checked on disk
+PATH_CHECK_DEBOUNCE_MS = 150
+
+# Delay after the last selection change before the details pane is refreshed
+SELECT_DEBOUNCE_MS = 60
+
+# Number of file details kept for quick reselection
+DETAILS_CACHE_SIZE = 64
+
+# Number of rows fetched per page as the file list is scrolled
+FILE_LIST_PAGE_SIZE = 200
+
 
 class STLCatalogApp:
     """Main application class for STL Catalog"""
@@ -36,8 +58,9 @@ class STLCatalogApp:
         self.root = root
         self.root.title("STL Catalog")
         
-        # Load settings
+        # Load settings, remembering their saved form so unchanged settings aren't rewritten
         self.settings = load_settings()
+        self._settings_snapshot = self._serialize_settings()
         
         # First apply the default geometry to ensure a reasonable size
         self.root.geometry("800x600")
@@ -47,31 +70,65 @@ class STLCatalogApp:
         
         # Apply saved window geometry if enabled
         if self.settings.get("remember_window_geometry", False):
-            # Use saved geometry
+            # Flush pending geometry work so the saved values apply deterministically
+            self.root.update_idletasks()
+            
+            # Use saved geometry, falling back to the persisted geometry file
             geometry_str = self.settings.get("window_geometry", "")
-            if geometry_str:
-                # Delay to ensure window is fully created
-                self.root.after(100, lambda: self.root.geometry(geometry_str))
+            apply_window_geometry(self.root, geometry_str)
                 
             # Check for maximized state
             if self.settings.get("window_maximized", False):
-                # Delay to ensure window is fully created before maximizing
-                self.root.after(200, self.maximize_window)
+                self.maximize_window()
+        
+        # Track the geometry as the window moves or resizes
+        install_geometry_saver(self.root, self.settings)
         
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_window_close)
         
-        # Ensure database exists
-        DatabaseManager.create_database()
+        # Settings dialog, built the first time it is opened
+        self._settings_dialog = None
+        
+        # Tags are loaded along with the database once the window is up
+        self.all_tags = []
+        self._db_ready = False
         
-        # Get all tags
-        self.all_tags = DatabaseManager.collect_all_tags()
+        # (id, name) pairs loaded into the file list, the search they match,
+        # and whether more pages remain to be loaded on scroll
+        self._shown_rows = []
+        self._list_search = None
+        self._list_exhausted = True
+        self._page_load_id = None
+        
+        # File ids selected when the details were last shown, and the pending
+        # (debounced) refresh of the details pane
+        self._last_selection = None
+        self._select_job = None
+        
+        # File ids whose details are being prefetched
+        self._prefetching = set()
 
         # List to store related STL files when browsing a folder
         self.related_stl_files = []
         
-        # Tag checkbox variables dictionary
+        # Background tag refresh state
+        self._tags_refreshing = False
+        self._tags_dirty = False
+        
+        # Tag checkbox variables and widgets, keyed by tag
         self.tag_vars = {}
+        self._selected_tags = set()
+        self.tag_widgets = {}
+        
+        # Tags currently laid out in the checkbox grid, in display order
+        self.gridded_tags = []
+        
+        # Recently viewed file details, most recent last
+        self._details_cache = OrderedDict()
+        
+        # File whose existence is being checked for the View button
+        self._view_check_file_id = None
         
         # Edit mode tracking
         self.edit_mode = False
@@ -84,28 +141,43 @@ class STLCatalogApp:
         # Create UI components
         self.create_ui()
         
-        # Migrate JSON data if it exists and database is empty
-        DatabaseManager.migrate_json_if_needed()
+        # Prepare the database off the UI thread so the window paints immediately
+        run_in_background(self.root, self._bootstrap_db, (), self._finish_bootstrap)
+    
+    def _bootstrap_db(self):
+        """Create/migrate the database and load tags (runs on a worker thread)
+        
+        Returns:
+            list: All tags, or None if the database couldn't be prepared
+        """
+        try:
+            # Ensure database exists
+            DatabaseManager.create_database()
+            
+            # Migrate JSON data if it exists and database is empty
+            DatabaseManager.migrate_json_if_needed()
+            
+            # Get all tags
+            tags = DatabaseManager.collect_all_tags()
+        except Exception as e:
+            print(f"Error preparing database: {e}")
+            tags = None
+        return tags
+    
+    def _finish_bootstrap(self, tags):
+        """Populate the UI once the database is ready"""
+        self._db_ready = True
+        if tags is not None:
+            self.all_tags = tags
+            self.refresh_tag_checkboxes()
+        
+        # Update file list
+        self.update_file_list()
     
     def on_window_close(self):
         """Handle window close event"""
         # Check if window is maximized - use platform-specific approaches
-        is_maximized = False
-        
-        if sys.platform == "win32":
-            # Windows-specific approach
-            is_maximized = self.root.wm_state() == 'zoomed'
-        else:
-            # Linux/macOS approach - safely check if the attribute exists
-            try:
-                is_maximized = bool(self.root.attributes('-zoomed'))
-            except tk.TclError:
-                # Attribute not supported, try alternative method
-                try:
-                    is_maximized = bool(self.root.attributes('-fullscreen'))
-                except tk.TclError:
-                    # Neither attribute works, default to False
-                    is_maximized = False
+        is_maximized = is_window_maximized(self.root)
         
         # Save maximized state in settings
         self.settings["window_maximized"] = is_maximized
@@ -115,12 +187,17 @@ class STLCatalogApp:
             # Save window geometry if enabled
             save_window_geometry(self.root, self.settings)
         
-        # Save settings
-        save_settings(self.settings)
+        # Save settings only if something changed during this session
+        if self._serialize_settings() != self._settings_snapshot:
+            save_settings(self.settings)
         
         # Close window
         self.root.destroy()
     
+    def _serialize_settings(self):
+        """Serialize settings in a stable form for change detection"""
+        return json.dumps(self.settings, sort_keys=True)
+    
     def center_window(self):
         """Center the window on the screen"""
         # Get screen width and height
@@ -157,12 +234,16 @@ class STLCatalogApp:
 
     def create_ui(self):
         """Create the user interface"""
+        # Shared fonts so Tk resolves each one only once
+        self._title_font = tkFont.Font(family="Arial", size=16, weight="bold")
+        self._header_font = tkFont.Font(family="Arial", size=14, weight="bold")
+        
         # Top bar for settings
         top_bar = ttk.Frame(self.main_frame)
         top_bar.pack(fill=tk.X, pady=(0, 10))
         
         # App title on left
-        ttk.Label(top_bar, text="STL Catalog", font=("Arial", 16, "bold")).pack(side=tk.LEFT)
+        ttk.Label(top_bar, text="STL Catalog", font=self._title_font).pack(side=tk.LEFT)
         
         # Settings button on right
         settings_button = ttk.Button(top_bar, text="⚙️ Settings", command=self.open_settings)
@@ -178,7 +259,7 @@ class STLCatalogApp:
         
         # Form label (changes based on edit mode)
         self.form_label_var = tk.StringVar(value="Add STL File")
-        self.form_label = ttk.Label(left_panel, textvariable=self.form_label_var, font=("Arial", 14, "bold"))
+        self.form_label = ttk.Label(left_panel, textvariable=self.form_label_var, font=self._header_font)
         self.form_label.pack(pady=(0, 10))
         
         # File selection
@@ -202,6 +283,9 @@ class STLCatalogApp:
         self.quick_render_button.pack(side=tk.LEFT, padx=5)
         
         # Add a trace to the file_path_var to enable/disable the Quick Render button
+        self._path_check_after_id = None
+        self._last_checked_path = None
+        self._last_path_valid = False
         self.file_path_var.trace_add("write", self.update_quick_render_button_state)
         
         # Name input
@@ -246,7 +330,7 @@ class STLCatalogApp:
         self.tag_checkboxes_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Create checkboxes for existing tags
-        self.create_tag_checkboxes()
+        self.refresh_tag_checkboxes()
         
         # Buttons frame
         buttons_frame = ttk.Frame(left_panel)
@@ -274,7 +358,7 @@ class STLCatalogApp:
         right_panel = ttk.Frame(content_frame, padding="5")
         right_panel.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
-        ttk.Label(right_panel, text="Catalog", font=("Arial", 14, "bold")).pack(pady=(0, 10))
+        ttk.Label(right_panel, text="Catalog", font=self._header_font).pack(pady=(0, 10))
         
         # Search frame
         search_frame = ttk.Frame(right_panel)
@@ -282,7 +366,8 @@ class STLCatalogApp:
         
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", lambda name, index, mode: self.update_file_list())
+        self._search_after_id = None
+        self.search_var.trace_add("write", self._on_search_changed)
         ttk.Entry(search_frame, textvariable=self.search_var).pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
         # Control buttons for catalog entries
@@ -305,18 +390,20 @@ class STLCatalogApp:
         )
         self.delete_button.pack(side=tk.LEFT, padx=5)
         
-        # File listbox with scrollbar
+        # File list with scrollbar; a Treeview only renders the visible rows and
+        # each item's iid is its file id
         list_frame = ttk.Frame(right_panel)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.file_listbox = tk.Listbox(list_frame, width=40, height=15, selectmode=tk.EXTENDED)
-        self.file_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.file_listbox.bind('<<ListboxSelect>>', self.on_file_select)
-        self.file_listbox.bind('<Double-1>', self.on_file_double_click)
+        self.file_tree = ttk.Treeview(list_frame, show="tree", height=15, selectmode="extended")
+        self.file_tree.column("#0", width=300)
+        self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.file_tree.bind('<<TreeviewSelect>>', self.on_file_select)
+        self.file_tree.bind('<Double-1>', self.on_file_double_click)
         
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.file_listbox.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.file_listbox.configure(yscrollcommand=scrollbar.set)
+        self.file_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.file_tree.yview)
+        self.file_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.file_tree.configure(yscrollcommand=self._on_file_list_scroll)
         
         # Details area
         self.details_frame = ttk.LabelFrame(right_panel, text="Details")
@@ -343,15 +430,37 @@ class STLCatalogApp:
         self.details_text = ScrolledText(details_layout, width=40, height=10, wrap=tk.WORD)
         self.details_text.pack(fill=tk.BOTH, expand=True)
         self.details_text.config(state=tk.DISABLED)
-        
-        # Update file list
+    
+    def _on_search_changed(self, *args):
+        """Refresh the file list once typing in the search box pauses"""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._run_search)
+    
+    def _run_search(self):
+        """Run the debounced search"""
+        self._search_after_id = None
         self.update_file_list()
     
     def update_quick_render_button_state(self, *args):
+        """Schedule a Quick Render button update once the file path stops changing"""
+        if self._path_check_after_id:
+            self.root.after_cancel(self._path_check_after_id)
+        self._path_check_after_id = self.root.after(PATH_CHECK_DEBOUNCE_MS, self._check_quick_render_path)
+    
+    def _check_quick_render_path(self):
         """Enable or disable the Quick Render button based on file path"""
+        self._path_check_after_id = None
         file_path = self.file_path_var.get().strip()
         
-        if file_path and os.path.exists(file_path) and file_path.lower().endswith('.stl'):
+        # Only touch the filesystem when the path has actually changed
+        if file_path != self._last_checked_path:
+            self._last_checked_path = file_path
+            self._last_path_valid = bool(
+                file_path and file_path.lower().endswith('.stl') and os.path.exists(file_path)
+            )
+        
+        if self._last_path_valid:
             self.quick_render_button.config(state=tk.NORMAL)
         else:
             self.quick_render_button.config(state=tk.DISABLED)
@@ -391,7 +500,7 @@ class STLCatalogApp:
 
     def select_main_stl_file(self):
         """Open a dialog to select the main STL file from the folder"""
-        if not hasattr(self, 'related_stl_files') or not self.related_stl_files:
+        if not self.related_stl_files:
             return
         
         # Create a dialog
@@ -416,9 +525,7 @@ class STLCatalogApp:
         file_listbox.configure(yscrollcommand=scrollbar.set)
         
         # Fill listbox with file names
-        for file_path in self.related_stl_files:
-            file_name = os.path.basename(file_path)
-            file_listbox.insert(tk.END, file_name)
+        file_listbox.insert(tk.END, *[os.path.basename(p) for p in self.related_stl_files])
         
         # Select the first file by default
         if self.related_stl_files:
@@ -440,22 +547,31 @@ class STLCatalogApp:
         
         ttk.Button(button_frame, text="Select", command=on_select).pack(side=tk.RIGHT, padx=5)
         ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        
+        # Block until the dialog is closed so the grab is released with it
+        dialog.wait_window()
 
     def browse_file(self):
         """Open file dialog to select an STL file"""
         browse_stl_file(self.root, self.file_path_var, self.name_var, self.edit_mode)
     
     def open_settings(self):
-        """Open settings dialog"""
-        open_settings_dialog(
-            self.root, 
-            self.settings, 
-            self.export_database_callback, 
-            self.import_database_callback
-        )
+        """Open settings dialog, reusing it after the first time"""
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(
+                self.root, 
+                self.settings, 
+                self.export_database_callback, 
+                self.import_database_callback
+            )
+        self._settings_dialog.open()
         
     def open_tag_manager(self):
         """Open tag manager dialog"""
+        # Tags can't be managed until the database has been prepared
+        if not self._db_ready:
+            return
+        
         # Get current tags from the tags text box
         current_tags = [tag.strip() for tag in self.tags_var.get().split(',') if tag.strip()]
         
@@ -467,36 +583,85 @@ class STLCatalogApp:
             self.handle_tag_updates
         )
 
-    def create_tag_checkboxes(self):
-        """Create checkboxes for all known tags in alphabetical order"""
-        # Clear existing checkboxes
-        for widget in self.tag_checkboxes_frame.winfo_children():
-            widget.destroy()
-        
-        # Create a new set of checkboxes
-        row = 0
-        col = 0
+    def refresh_tag_checkboxes(self):
+        """Sync the tag checkboxes with all known tags in alphabetical order
+        
+        Only checkboxes for added or removed tags are created or destroyed.
+        """
         max_cols = 3  # Number of checkbox columns
         
-        # Sort tags alphabetically
-        sorted_tags = sorted(self.all_tags)
+        # all_tags is kept in alphabetical order
+        sorted_tags = list(self.all_tags)
+        if sorted_tags == self.gridded_tags:
+            return
+        
+        # Remove checkboxes for tags that no longer exist
+        current = set(sorted_tags)
+        for tag in [t for t in self.tag_widgets if t not in current]:
+            self.tag_widgets.pop(tag).destroy()
+            self.tag_vars.pop(tag, None)
+            self._selected_tags.discard(tag)
         
+        # Create checkboxes only for new tags
         for tag in sorted_tags:
+            if tag in self.tag_widgets:
+                continue
+            
             if tag not in self.tag_vars:
                 self.tag_vars[tag] = tk.BooleanVar(value=False)
             
-            cb = ttk.Checkbutton(
+            self.tag_widgets[tag] = ttk.Checkbutton(
                 self.tag_checkboxes_frame, 
                 text=tag, 
                 variable=self.tag_vars[tag],
-                command=lambda t=tag: self.update_tags_from_checkboxes()
+                command=functools.partial(self._on_tag_toggled, tag)
             )
-            cb.grid(row=row, column=col, sticky="w", padx=5, pady=2)
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
+        
+        # Lay out all checkboxes in sorted order
+        for i, tag in enumerate(sorted_tags):
+            self.tag_widgets[tag].grid(row=i // max_cols, column=i % max_cols, sticky="w", padx=5, pady=2)
+        
+        self.gridded_tags = sorted_tags
+    
+    def _refresh_tags_async(self):
+        """Reload all tags on a worker thread, keeping the current tags on screen meanwhile"""
+        if self._tags_refreshing:
+            # Reload again once the in-flight refresh finishes
+            self._tags_dirty = True
+            return
+        
+        self._tags_refreshing = True
+        run_in_background(self.root, self._load_tags_worker, (), self._apply_tags)
+    
+    def _load_tags_worker(self):
+        """Fetch all tags from the database (runs on a worker thread)
+        
+        Returns:
+            list: All tags, or None if they couldn't be loaded
+        """
+        try:
+            tags = DatabaseManager.collect_all_tags()
+        except Exception as e:
+            print(f"Error refreshing tags: {e}")
+            tags = None
+        return tags
+    
+    def _apply_tags(self, new_tags):
+        """Apply freshly loaded tags on the UI thread"""
+        self._tags_refreshing = False
+        if self._tags_dirty:
+            self._tags_dirty = False
+            self._refresh_tags_async()
+        
+        if new_tags is None or new_tags == self.all_tags:
+            return
+        
+        # collect_all_tags() returns tags already sorted, so they can be used as-is
+        self.all_tags = new_tags
+        self.refresh_tag_checkboxes()
+        
+        # Checkboxes for newly seen tags should reflect the tags field
+        self.update_checkboxes_from_tags()
     
     def handle_tag_updates(self, renamed_tags):
         """Handle tag updates from the Tag Manager
@@ -511,66 +676,73 @@ class STLCatalogApp:
         current_tags = [tag.strip() for tag in self.tags_var.get().split(',') if tag.strip()]
         
         # Replace renamed tags
-        updated_tags = []
-        for tag in current_tags:
-            if tag in renamed_tags:
-                updated_tags.append(renamed_tags[tag])
-            else:
-                updated_tags.append(tag)
+        updated_tags = [renamed_tags.get(tag, tag) for tag in current_tags]
         
         # Update the tags text box
         self.tags_var.set(', '.join(updated_tags))
         
-        # Refresh all tags
-        self.all_tags = DatabaseManager.collect_all_tags()
-        self.create_tag_checkboxes()
-        
         # Update checkbox states based on the updated tags
-        for tag, var in self.tag_vars.items():
-            var.set(tag in updated_tags)
+        self._set_checked_tags(updated_tags)
+        
+        # Refresh all tags; checkboxes for new names are synced when it completes
+        self._refresh_tags_async()
 
 
+    def _on_tag_toggled(self, tag):
+        """Record a single checkbox change and update the tags input field
+        
+        Args:
+            tag: The tag whose checkbox was clicked
+        """
+        if self.tag_vars[tag].get():
+            self._selected_tags.add(tag)
+        else:
+            self._selected_tags.discard(tag)
+        self.update_tags_from_checkboxes()
+    
     def update_tags_from_checkboxes(self):
         """Update tags input field based on checkbox states"""
-        selected_tags = []
+        self.tags_var.set(', '.join(sorted(self._selected_tags)))
+    
+    def _set_checked_tags(self, tags):
+        """Check exactly the checkboxes for the given tags
         
-        for tag, var in self.tag_vars.items():
-            if var.get():
-                selected_tags.append(tag)
-                
-        self.tags_var.set(', '.join(selected_tags))
+        Args:
+            tags: Iterable of tag names to check; unknown tags are ignored
+        """
+        selected = {tag for tag in tags if tag in self.tag_vars}
+        
+        # Only touch the checkboxes whose state actually changes
+        for tag in selected ^ self._selected_tags:
+            self.tag_vars[tag].set(tag in selected)
+        self._selected_tags = selected
     
     def update_checkboxes_from_tags(self):
         """Update checkboxes based on tags input field"""
-        # Reset all checkboxes
-        for tag, var in self.tag_vars.items():
-            var.set(False)
-            
         # Get current tags from input field
         current_tags = [t.strip() for t in self.tags_var.get().split(',') if t.strip()]
         
         # Set checkboxes for matching tags
-        for tag in current_tags:
-            if tag in self.tag_vars:
-                self.tag_vars[tag].set(True)
+        self._set_checked_tags(current_tags)
     
     def add_new_tag(self):
         """Add a new tag to the list of available tags"""
         new_tag = self.new_tag_var.get().strip()
         
-        if not new_tag:
+        # Tags can't be stored until the database has been prepared
+        if not new_tag or not self._db_ready:
             return
             
         # Add to database
         if DatabaseManager.add_tag(new_tag):
             # Update local list
             if new_tag not in self.all_tags:
-                self.all_tags.append(new_tag)
-                self.all_tags.sort()  # Keep alphabetical order
-                self.create_tag_checkboxes()
+                bisect.insort(self.all_tags, new_tag)  # Keep alphabetical order
+                self.refresh_tag_checkboxes()
                 
                 # Select the new tag
                 self.tag_vars[new_tag].set(True)
+                self._selected_tags.add(new_tag)
                 self.update_tags_from_checkboxes()
                 
             # Clear the input field
@@ -598,16 +770,28 @@ class STLCatalogApp:
             return
         
         # Get related files
-        related_files = []
-        if hasattr(self, 'related_stl_files'):
-            related_files = self.related_stl_files
+        related_files = self.related_stl_files
+        
+        # Add to database with related files on a worker thread; block resubmits meanwhile
+        self.submit_button.config(state=tk.DISABLED)
+        run_in_background(
+            self.root,
+            DatabaseManager.add_or_update_file_with_related,
+            (None, file_path, related_files, name, tags),
+            lambda success: self._finish_add(success, name)
+        )
+    
+    def _finish_add(self, success, name):
+        """Update the UI once a new entry has been written"""
+        self.submit_button.config(state=tk.NORMAL)
         
-        # Add to database with related files
-        if DatabaseManager.add_or_update_file_with_related(None, file_path, related_files, name, tags):
+        if success:
             # Show success message if enabled
             if self.settings.get("show_success_messages", True):
                 messagebox.showinfo("Success", f"Added '{name}' to catalog")
                 
+            self._details_cache.clear()
+            
             # Clear inputs and update UI
             self.file_path_var.set("")
             self.name_var.set("")
@@ -615,13 +799,11 @@ class STLCatalogApp:
             self.related_stl_files = []
             
             # Reset all checkboxes
-            for tag, var in self.tag_vars.items():
-                var.set(False)
+            self._set_checked_tags(())
                 
             # Update UI
             self.update_file_list()
-            self.all_tags = DatabaseManager.collect_all_tags()
-            self.create_tag_checkboxes()
+            self._refresh_tags_async()
         else:
             messagebox.showerror("Error", "Failed to add item to catalog")
     
@@ -643,15 +825,29 @@ class STLCatalogApp:
             return
         
         # Get related files
-        related_files = []
-        if hasattr(self, 'related_stl_files'):
-            related_files = self.related_stl_files
+        related_files = self.related_stl_files
+        file_id = self.editing_file_id
         
-        # Update database with related files
-        if DatabaseManager.add_or_update_file_with_related(self.editing_file_id, file_path, related_files, name, tags):
+        # Update database with related files on a worker thread; block resubmits meanwhile
+        self.submit_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.DISABLED)
+        run_in_background(
+            self.root,
+            DatabaseManager.add_or_update_file_with_related,
+            (file_id, file_path, related_files, name, tags),
+            lambda success: self._finish_update(success, file_id, name)
+        )
+    
+    def _finish_update(self, success, file_id, name):
+        """Update the UI once an edited entry has been written"""
+        self.submit_button.config(state=tk.NORMAL)
+        
+        if success:
             # Show success message if enabled
             if self.settings.get("show_success_messages", True):
                 messagebox.showinfo("Success", f"Updated '{name}' in catalog")
+            
+            self._details_cache.pop(file_id, None)
                 
             # Exit edit mode
             self.exit_edit_mode()
@@ -659,43 +855,132 @@ class STLCatalogApp:
             # Update UI
             self.update_file_list()
         else:
+            # Still editing, so the edit can be cancelled again
+            self.cancel_button.config(state=tk.NORMAL)
             messagebox.showerror("Error", "Failed to update item in catalog")
 
     
     def update_file_list(self):
-        """Update the file listbox with filtered catalog items"""
-        self.file_listbox.delete(0, tk.END)
+        """Update the file list with filtered catalog items"""
+        # Nothing to list until the database has been prepared
+        if not self._db_ready:
+            return
+        
+        # A pending page load belongs to the previous query
+        if self._page_load_id is not None:
+            self.root.after_cancel(self._page_load_id)
+            self._page_load_id = None
         
+        # Reload as many rows as are already loaded for the same search, so a
+        # refresh keeps the rows (and selection) the user has scrolled to
         search_term = self.search_var.get()
+        limit = FILE_LIST_PAGE_SIZE
+        if search_term == self._list_search:
+            limit = max(limit, len(self._shown_rows))
+        self._list_search = search_term
         
-        # Get files from database
-        files = DatabaseManager.get_filtered_files(search_term)
+        rows = DatabaseManager.list_files(search_term, limit)
+        self._list_exhausted = len(rows) < limit
+        
+        # Leave the list (and its selection) alone if the results haven't changed
+        if rows == self._shown_rows:
+            return
+        
+        # Keep the leading rows that are unchanged and replace the rest
+        keep = 0
+        for old_row, new_row in zip(self._shown_rows, rows):
+            if old_row != new_row:
+                break
+            keep += 1
+        # Hide the list while repopulating so it isn't laid out again per row
+        self.file_tree.pack_forget()
+        try:
+            stale = self.file_tree.get_children()[keep:]
+            if stale:
+                self.file_tree.delete(*stale)
+            
+            # Each row's iid is its file id
+            for file_id, name in rows[keep:]:
+                self.file_tree.insert("", tk.END, iid=str(file_id), text=name)
+        finally:
+            self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.file_scrollbar)
+        self._shown_rows = rows
+        
+        # Match the buttons and details to the selection that remains (edit mode
+        # keeps the list controls disabled and refreshes them when it exits)
+        self._last_selection = None
+        if not self.edit_mode:
+            self.on_file_select(None)
+    
+    def _on_file_list_scroll(self, first, last):
+        """Update the scrollbar and fetch more rows when nearing the end of the list"""
+        self.file_scrollbar.set(first, last)
         
-        # We'll store mapping of index -> file_id
-        self.listbox_mapping = {}
+        if float(last) > 0.9 and not self._list_exhausted and self._page_load_id is None:
+            self._page_load_id = self.root.after_idle(self._load_next_file_page)
+    
+    def _load_next_file_page(self):
+        """Append the next page of results after the last loaded row"""
+        self._page_load_id = None
+        if self._list_exhausted or not self._shown_rows:
+            return
         
-        for index, file_data in files.items():
-            self.file_listbox.insert(tk.END, file_data['name'])
-            # Store file_id in our mapping
-            self.listbox_mapping[index] = file_data['id']
+        last_id, last_name = self._shown_rows[-1]
+        rows = DatabaseManager.list_files(self._list_search, FILE_LIST_PAGE_SIZE, (last_name, last_id))
+        self._list_exhausted = len(rows) < FILE_LIST_PAGE_SIZE
         
-        # Disable edit/delete buttons if no selection
-        self.edit_button.config(state=tk.DISABLED)
-        self.delete_button.config(state=tk.DISABLED)
-        self.view_button.config(state=tk.DISABLED)
+        for file_id, name in rows:
+            self.file_tree.insert("", tk.END, iid=str(file_id), text=name)
+        self._shown_rows.extend(rows)
     
     def update_after_database_change(self):
         """Update UI after database changes"""
+        # Cached details may no longer match the database
+        self._details_cache.clear()
+        
         # Refresh tags list
-        self.all_tags = DatabaseManager.collect_all_tags()
-        self.create_tag_checkboxes()
+        self._refresh_tags_async()
         
         # Update file list
         self.update_file_list()
     
+    def _after_files_deleted(self, file_ids):
+        """Update UI after files were deleted, dropping only their cached details"""
+        for file_id in file_ids:
+            self._details_cache.pop(file_id, None)
+        
+        # Refresh tags list and file list
+        self._refresh_tags_async()
+        self.update_file_list()
+    
     def on_file_select(self, event):
+        """Schedule a details refresh for the selected files
+        
+        Selection events are coalesced so that holding an arrow key only loads
+        the final selection. Direct calls (event is None) refresh immediately.
+        """
+        if self._select_job is not None:
+            self.root.after_cancel(self._select_job)
+            self._select_job = None
+        
+        if event is None:
+            self._do_file_select(force=True)
+        else:
+            self._select_job = self.root.after(SELECT_DEBOUNCE_MS, self._do_file_select)
+    
+    def _do_file_select(self, force=False):
         """Display details for the selected file and enable/disable buttons"""
-        selection = self.file_listbox.curselection()
+        self._select_job = None
+        selection = self._selected_file_ids()
+        
+        # Selection events also fire when the selection hasn't actually changed
+        if not force and selection == self._last_selection:
+            return
+        self._last_selection = selection
+        
+        # Any pending file check belongs to the previous selection
+        self._view_check_file_id = None
+        
         if not selection:
             self.edit_button.config(state=tk.DISABLED)
             self.delete_button.config(state=tk.DISABLED)
@@ -714,60 +999,154 @@ class STLCatalogApp:
         # Enable delete button for any selection
         self.delete_button.config(state=tk.NORMAL)
                     
-        # Get the file_id from our mapping for the first selected item
-        index = selection[0]
-        if index not in self.listbox_mapping:
-            return
-                    
-        file_id = self.listbox_mapping[index]
-                
-        # Get file details from database using the new method
-        details = DatabaseManager.get_file_details_with_related(file_id)
+        # Disable the view button until the file is known to exist (never enabled
+        # for multiple selections)
+        self.view_button.config(state=tk.DISABLED)
+        
+        # Show details for the first selected item
+        file_id = selection[0]
                 
+        # Reuse recently viewed details, otherwise load them off the UI thread
+        if file_id in self._details_cache:
+            self._show_file_details(selection, self._get_file_details(file_id))
+        else:
+            run_in_background(
+                self.root,
+                DatabaseManager.get_file_details_with_related,
+                (file_id,),
+                lambda details: self._on_details_loaded(selection, details)
+            )
+        
+        # Warm the cache for the neighbouring rows while the user looks at this one
+        if len(selection) == 1:
+            self._prefetch_neighbours(file_id)
+    
+    def _prefetch_neighbours(self, file_id):
+        """Load details for the rows above and below a file in the background"""
+        iid = str(file_id)
+        for neighbour in (self.file_tree.prev(iid), self.file_tree.next(iid)):
+            if not neighbour:
+                continue
+            neighbour_id = int(neighbour)
+            if neighbour_id in self._details_cache or neighbour_id in self._prefetching:
+                continue
+            
+            self._prefetching.add(neighbour_id)
+            run_in_background(
+                self.root,
+                DatabaseManager.get_file_details_with_related,
+                (neighbour_id,),
+                functools.partial(
+                    self._on_details_prefetched, neighbour_id, DatabaseManager.get_data_version()
+                )
+            )
+    
+    def _on_details_prefetched(self, file_id, data_version, details):
+        """Cache prefetched details unless the catalog changed while they were loading"""
+        self._prefetching.discard(file_id)
+        if details and data_version == DatabaseManager.get_data_version():
+            self._remember_file_details(file_id, details)
+    
+    def _on_details_loaded(self, selection, details):
+        """Cache and show details loaded in the background, unless the selection has moved on"""
+        if selection != self._last_selection or not details:
+            return
+        self._remember_file_details(selection[0], details)
+        self._show_file_details(selection, details)
+    
+    def _show_file_details(self, selection, details):
+        """Fill the details pane and start checking whether the file can be viewed
+        
+        Args:
+            selection: Selected file ids; details belong to the first one
+            details: File details from get_file_details_with_related
+        """
         if not details:
             return
+        file_id = selection[0]
                     
         # Update details text
         self.details_text.config(state=tk.NORMAL)
         self.details_text.delete(1.0, tk.END)
                 
-        details_text = f"Name: {details['name']}\n\n"
-        details_text += f"Main File: {os.path.basename(details['file_path'])}\n\n"
+        basename = os.path.basename
+        parts = [
+            f"Name: {details['name']}\n\n",
+            f"Main File: {basename(details['file_path'])}\n\n",
+        ]
         
         # Add related files if multi-part
         if details['is_multi_part'] and details['related_files']:
-            details_text += "Related Files:\n"
-            for i, related_file in enumerate(details['related_files']):
-                details_text += f"  {i+1}. {os.path.basename(related_file)}\n"
-            details_text += "\n"
+            parts.append("Related Files:\n")
+            parts.extend(
+                f"  {i}. {name}\n"
+                for i, name in enumerate(map(basename, details['related_files']), 1)
+            )
+            parts.append("\n")
         
-        details_text += f"Date Added: {details['date_added']}\n\n"
-        details_text += f"Tags: {details['tags']}"
+        parts.append(f"Date Added: {details['date_added']}\n\n")
+        parts.append(f"Tags: {details['tags']}")
                 
-        self.details_text.insert(tk.INSERT, details_text)
+        self.details_text.insert(tk.INSERT, "".join(parts))
         self.details_text.config(state=tk.DISABLED)
-                
-        # Enable view button if file exists and selection is single
-        if len(selection) == 1 and os.path.exists(details['file_path']):
-            self.view_button.config(state=tk.NORMAL)
-        else:
-            # Disable the view button for multiple selections
-            self.view_button.config(state=tk.DISABLED)
+        
+        # Checking the file can be slow on network drives, so do it off the UI thread
+        if len(selection) == 1:
+            self._view_check_file_id = file_id
+            run_in_background(
+                self.root, os.path.exists, (details['file_path'],),
+                functools.partial(self._set_view_btn, file_id)
+            )
+    
+    def _selected_file_ids(self):
+        """Get the ids of the selected files
+        
+        Returns:
+            list: File ids of the selected rows
+        """
+        return [int(iid) for iid in self.file_tree.selection()]
+    
+    def _set_view_btn(self, file_id, enabled):
+        """Enable the View button if the check is still for the current selection"""
+        if file_id != self._view_check_file_id:
+            return
+        self.view_button.config(state=tk.NORMAL if enabled else tk.DISABLED)
+    
+    def _get_file_details(self, file_id):
+        """Get file details including related files, via a small LRU cache
+        
+        Args:
+            file_id: ID of the file
+            
+        Returns:
+            dict: File details, or None if the file doesn't exist
+        """
+        if file_id in self._details_cache:
+            self._details_cache.move_to_end(file_id)
+            return self._details_cache[file_id]
+        
+        details = DatabaseManager.get_file_details_with_related(file_id)
+        if details:
+            self._remember_file_details(file_id, details)
+        return details
+    
+    def _remember_file_details(self, file_id, details):
+        """Add file details to the LRU cache, evicting the least recently used entry"""
+        self._details_cache[file_id] = details
+        self._details_cache.move_to_end(file_id)
+        if len(self._details_cache) > DETAILS_CACHE_SIZE:
+            self._details_cache.popitem(last=False)
     
     def view_selected_stl(self):
         """Open the STL viewer for the selected file"""
-        selection = self.file_listbox.curselection()
+        selection = self._selected_file_ids()
         if not selection or len(selection) != 1:
             return
                 
-        index = selection[0]
-        if index not in self.listbox_mapping:
-            return
-                
-        file_id = self.listbox_mapping[index]
+        file_id = selection[0]
         
-        # Use the new method that includes related files
-        details = DatabaseManager.get_file_details_with_related(file_id)
+        # Get details including related files, reusing recently viewed entries
+        details = self._get_file_details(file_id)
         
         if not details:
             return
@@ -777,7 +1156,7 @@ class STLCatalogApp:
 
     def on_file_double_click(self, event):
         """Handle double-click on file entry to edit it"""
-        selection = self.file_listbox.curselection()
+        selection = self.file_tree.selection()
         if not selection or len(selection) != 1:
             return
             
@@ -790,7 +1169,7 @@ class STLCatalogApp:
     
     def edit_selected(self):
         """Load the selected file for editing"""
-        selection = self.file_listbox.curselection()
+        selection = self._selected_file_ids()
         if not selection or len(selection) != 1:
             return
                 
@@ -798,15 +1177,10 @@ class STLCatalogApp:
         if self.edit_mode:
             return
                 
-        # Get the file_id from our mapping
-        index = selection[0]
-        if index not in self.listbox_mapping:
-            return
-                
-        file_id = self.listbox_mapping[index]
+        file_id = selection[0]
         
-        # Get file details from database using the new method
-        details = DatabaseManager.get_file_details_with_related(file_id)
+        # Get file details, reusing recently viewed entries
+        details = self._get_file_details(file_id)
         
         if not details:
             return
@@ -818,8 +1192,8 @@ class STLCatalogApp:
         self.file_path_var.set(details['file_path'])
         self.name_var.set(details['name'])
         
-        # Set related files
-        self.related_stl_files = details['related_files']
+        # Set related files (copied, since the cached details must not change)
+        self.related_stl_files = list(details['related_files'])
         if details['file_path'] not in self.related_stl_files:
             self.related_stl_files.append(details['file_path'])
         
@@ -842,7 +1216,7 @@ class STLCatalogApp:
         # Disable list controls while editing
         self.edit_button.config(state=tk.DISABLED)
         self.delete_button.config(state=tk.DISABLED)
-        self.file_listbox.config(state=tk.DISABLED)
+        self.file_tree.config(selectmode="none")
     
     def exit_edit_mode(self):
         """Exit edit mode and reset form"""
@@ -858,8 +1232,7 @@ class STLCatalogApp:
         self.tags_var.set("")
         
         # Reset all checkboxes
-        for tag, var in self.tag_vars.items():
-            var.set(False)
+        self._set_checked_tags(())
         
         # Update UI elements
         self.form_label_var.set("Add STL File")
@@ -867,7 +1240,7 @@ class STLCatalogApp:
         self.cancel_button.config(state=tk.DISABLED)
         
         # Re-enable list controls
-        self.file_listbox.config(state=tk.NORMAL)
+        self.file_tree.config(selectmode="extended")
         
         # Update selection state
         self.on_file_select(None)
@@ -878,25 +1251,24 @@ class STLCatalogApp:
     
     def delete_selected(self):
         """Delete selected entries from the catalog"""
-        selection = self.file_listbox.curselection()
+        selection = self.file_tree.selection()
         if not selection:
             return
         
-        # Get selected file IDs
-        file_ids = []
-        file_names = []
-        for index in selection:
-            if index in self.listbox_mapping:
-                file_id = self.listbox_mapping[index]
-                
-                # Get the file name for the confirmation message
-                name = self.file_listbox.get(index)
-                
-                file_ids.append(file_id)
-                file_names.append(name)
-        
-        # Use the file manager module to delete files
-        delete_files_from_catalog(file_ids, file_names, self.settings, self.update_after_database_change)
+        # Get selected file IDs, and their names for the confirmation message from
+        # the rows already loaded rather than asking the tree for each one
+        file_ids = [int(iid) for iid in selection]
+        loaded_names = dict(self._shown_rows)
+        file_names = [loaded_names[file_id] for file_id in file_ids]
+        
+        # Use the file manager module to delete files; block repeat deletes until it finishes
+        future = delete_files_from_catalog(
+            self.root, file_ids, file_names, self.settings,
+            lambda: self._after_files_deleted(file_ids),
+            done_callback=lambda: self.on_file_select(None)
+        )
+        if future is not None:
+            self.delete_button.config(state=tk.DISABLED)
         
         # Clear details if no selection
         self.details_text.config(state=tk.NORMAL)
@@ -905,19 +1277,26 @@ class STLCatalogApp:
     
     def export_database_callback(self):
         """Export database callback for settings dialog"""
-        export_database()
+        export_database(self.root)
     
     def import_database_callback(self):
         """Import database callback for settings dialog"""
-        if import_database(self.update_after_database_change):
-            # Clear any selection
-            self.on_file_select(None)
+        import_database(self.root, self._on_database_imported)
+    
+    def _on_database_imported(self):
+        """Refresh the UI after a successful import"""
+        self.update_after_database_change()
+        
+        # Clear any selection
+        self.on_file_select(None)
     
     def open_settings(self):
-        """Open settings dialog"""
-        open_settings_dialog(
-            self.root, 
-            self.settings, 
-            self.export_database_callback, 
-            self.import_database_callback
-        )
\ No newline at end of file
+        """Open settings dialog, reusing it after the first time"""
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(
+                self.root, 
+                self.settings, 
+                self.export_database_callback, 
+                self.import_database_callback
+            )
+        self._settings_dialog.open()
\ No newline at end of file
@@ -2,11 +2,99 @@
 File management operations for STL Catalog
 """
 import os
+import re
+import string
+import queue
+import logging
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
 
 from database_manager import DatabaseManager
 
+_log = logging.getLogger(__name__)
+
+# Separators turned into spaces, and leading numbering removed, in display names
+_SEPARATOR_RE = re.compile(r'[-_]+')
+_LEADING_NUMBER_RE = re.compile(r'^[\d\s]+')
+
+def _clean_display_name(raw):
+    """
+    Turn a file or folder name into a display name
+    
+    Args:
+        raw: File name without extension, or folder name
+        
+    Returns:
+        str: Name with separators as spaces, leading numbers removed and words capitalized
+    """
+    clean_name = string.capwords(_LEADING_NUMBER_RE.sub('', _SEPARATOR_RE.sub(' ', raw)))
+    
+    # If clean_name ended up empty, use original name
+    return clean_name or raw.capitalize()
+
+# Worker threads for database and file I/O, so the Tk main loop never blocks on it
+_pool = ThreadPoolExecutor(max_workers=2)
+
+# Finished operations, put by the worker threads and polled from the UI thread
+# (Tk may only be called from the thread running its main loop)
+_results = queue.Queue()
+_outstanding = 0
+_polling = False
+
+# How often the UI thread checks for finished operations
+RESULT_POLL_MS = 50
+
+def run_in_background(parent, func, args, on_done):
+    """
+    Run a blocking function on a worker thread and hand its result back to Tk
+    
+    Args:
+        parent: Widget whose event loop receives the result
+        func: Function to run on the worker thread
+        args: Tuple of arguments for func
+        on_done: Called on the UI thread with func's result (False if it raised)
+        
+    Returns:
+        Future: The pending operation
+    """
+    global _outstanding, _polling
+    
+    def post_result(future):
+        try:
+            result = future.result()
+        except Exception:
+            _log.exception("Background operation failed")
+            result = False
+        _results.put((on_done, result))
+    
+    future = _pool.submit(func, *args)
+    future.add_done_callback(post_result)
+    
+    # Poll for the result unless a poll is already running
+    _outstanding += 1
+    if not _polling:
+        _polling = True
+        parent.after(RESULT_POLL_MS, _poll_results, parent)
+    return future
+
+def _poll_results(parent):
+    """Deliver finished operations' results on the UI thread, polling while any are pending"""
+    global _outstanding, _polling
+    
+    try:
+        while True:
+            on_done, result = _results.get_nowait()
+            _outstanding -= 1
+            on_done(result)
+    except queue.Empty:
+        pass
+    finally:
+        if _outstanding:
+            parent.after(RESULT_POLL_MS, _poll_results, parent)
+        else:
+            _polling = False
+
 def browse_stl_file(parent, file_path_var, name_var, edit_mode=False):
     """
     Open file dialog to select an STL file
@@ -28,60 +116,98 @@ def browse_stl_file(parent, file_path_var, name_var, edit_mode=False):
         if not edit_mode or not name_var.get():
             filename = os.path.basename(filepath)
             name_without_ext = os.path.splitext(filename)[0]
-            
-            # Replace hyphens and underscores with spaces
-            clean_name = name_without_ext.replace('-', ' ').replace('_', ' ')
-            
-            # Remove leading numbers and spaces
-            clean_name = clean_name.lstrip('0123456789 ')
-            
-            # Capitalize the first letter of each word
-            clean_name = ' '.join(word.capitalize() for word in clean_name.split())
-            
-            # If clean_name ended up empty, use original name
-            if not clean_name:
-                clean_name = name_without_ext.capitalize()
-                
-            name_var.set(clean_name)
+            name_var.set(_clean_display_name(name_without_ext))
+
+# Success and failure messages for each catalog write
+_ACTION_MESSAGES = {
+    "add": ("Added '{name}' to catalog", "Failed to add item to catalog"),
+    "update": ("Updated '{name}' in catalog", "Failed to update item in catalog"),
+}
 
-def add_file_to_catalog(file_path, name, tags, settings, update_callback):
+def _prep(file_path, name, tags):
     """
-    Add a file to the catalog
+    Clean and validate catalog entry fields, showing an error if they're invalid
     
     Args:
         file_path: Path to the STL file
         name: Display name for the file
         tags: List of tags associated with the file
-        settings: Settings dictionary
-        update_callback: Callback to update UI after operation
         
     Returns:
-        bool: True if successful, False otherwise
+        tuple: (file_path, name, tags) cleaned up, or None if the input was invalid
     """
     file_path = file_path.strip()
     name = name.strip()
-    tags = [tag.strip() for tag in tags if tag.strip()]
     
     if not file_path:
         messagebox.showerror("Error", "Please select an STL file")
-        return False
+        return None
         
     if not name:
         messagebox.showerror("Error", "Please enter a name for the STL file")
-        return False
+        return None
+    
+    # Strip each tag once and drop empty ones
+    tags = [tag for tag in (t.strip() for t in tags) if tag]
+    return file_path, name, tags
+
+def _add_or_update_file(parent, file_id, file_path, name, tags, settings, update_callback, action):
+    """
+    Validate an entry and write it to the catalog on a worker thread
+    
+    Args:
+        parent: Parent window
+        file_id: Database ID of the file to update, or None to add it
+        file_path: Path to the STL file
+        name: Display name for the file
+        tags: List of tags associated with the file
+        settings: Settings dictionary
+        update_callback: Callback to update UI after operation
+        action: "add" or "update", selecting the messages shown
         
-    # Add to database
-    if DatabaseManager.add_or_update_file(None, file_path, name, tags):
-        # Show success message if enabled
-        if settings.get("show_success_messages", True):
-            messagebox.showinfo("Success", f"Added '{name}' to catalog")
-            
-        # Update UI
-        update_callback()
-        return True
-    else:
-        messagebox.showerror("Error", "Failed to add item to catalog")
-        return False
+    Returns:
+        Future: The pending operation, or None if the input was invalid
+    """
+    entry = _prep(file_path, name, tags)
+    if entry is None:
+        return None
+    file_path, name, tags = entry
+    success_message, error_message = _ACTION_MESSAGES[action]
+    
+    def finish(success):
+        if success:
+            # Show success message if enabled
+            if settings.get("show_success_messages", True):
+                messagebox.showinfo("Success", success_message.format(name=name))
+                
+            # Update UI
+            update_callback()
+        else:
+            messagebox.showerror("Error", error_message)
+    
+    return run_in_background(
+        parent, DatabaseManager.add_or_update_file, (file_id, file_path, name, tags), finish
+    )
+
+def add_file_to_catalog(parent, file_path, name, tags, settings, update_callback):
+    """
+    Add a file to the catalog
+    
+    The database write runs on a worker thread; messages and update_callback
+    run on the UI thread once it finishes.
+    
+    Args:
+        parent: Parent window
+        file_path: Path to the STL file
+        name: Display name for the file
+        tags: List of tags associated with the file
+        settings: Settings dictionary
+        update_callback: Callback to update UI after operation
+        
+    Returns:
+        Future: The pending operation, or None if the input was invalid
+    """
+    return _add_or_update_file(parent, None, file_path, name, tags, settings, update_callback, "add")
 
 def browse_stl_folder(parent, file_path_var, name_var, edit_mode=False):
     """
@@ -104,10 +230,12 @@ def browse_stl_folder(parent, file_path_var, name_var, edit_mode=False):
         return None, []
         
     # Get all STL files in the folder
-    stl_files = []
-    for file in os.listdir(folder_path):
-        if file.lower().endswith('.stl'):
-            stl_files.append(os.path.join(folder_path, file))
+    with os.scandir(folder_path) as entries:
+        stl_files = [
+            os.path.join(folder_path, entry.name)
+            for entry in entries
+            if entry.name.lower().endswith('.stl') and entry.is_file()
+        ]
     
     if not stl_files:
         messagebox.showinfo("No STL Files", "No STL files found in the selected folder.")
@@ -116,30 +244,20 @@ def browse_stl_folder(parent, file_path_var, name_var, edit_mode=False):
     # Auto-set name from folder name if not in edit mode or name is empty
     if not edit_mode or not name_var.get():
         folder_name = os.path.basename(folder_path)
-        
-        # Clean up the folder name
-        clean_name = folder_name.replace('-', ' ').replace('_', ' ')
-        
-        # Remove leading numbers and spaces
-        clean_name = clean_name.lstrip('0123456789 ')
-        
-        # Capitalize the first letter of each word
-        clean_name = ' '.join(word.capitalize() for word in clean_name.split())
-        
-        # If clean_name ended up empty, use original name
-        if not clean_name:
-            clean_name = folder_name.capitalize()
-            
-        name_var.set(clean_name)
+        name_var.set(_clean_display_name(folder_name))
     
     return folder_path, stl_files
 
 
-def update_file_in_catalog(file_id, file_path, name, tags, settings, update_callback):
+def update_file_in_catalog(parent, file_id, file_path, name, tags, settings, update_callback):
     """
     Update a file in the catalog
     
+    The database write runs on a worker thread; messages and update_callback
+    run on the UI thread once it finishes.
+    
     Args:
+        parent: Parent window
         file_id: Database ID of the file to update
         file_path: Path to the STL file
         name: Display name for the file
@@ -148,48 +266,30 @@ def update_file_in_catalog(file_id, file_path, name, tags, settings, update_call
         update_callback: Callback to update UI after operation
         
     Returns:
-        bool: True if successful, False otherwise
+        Future: The pending operation, or None if the input was invalid
     """
-    file_path = file_path.strip()
-    name = name.strip()
-    tags = [tag.strip() for tag in tags if tag.strip()]
-    
-    if not file_path:
-        messagebox.showerror("Error", "Please select an STL file")
-        return False
-        
-    if not name:
-        messagebox.showerror("Error", "Please enter a name for the STL file")
-        return False
-        
-    # Update database
-    if DatabaseManager.add_or_update_file(file_id, file_path, name, tags):
-        # Show success message if enabled
-        if settings.get("show_success_messages", True):
-            messagebox.showinfo("Success", f"Updated '{name}' in catalog")
-            
-        # Update UI
-        update_callback()
-        return True
-    else:
-        messagebox.showerror("Error", "Failed to update item in catalog")
-        return False
+    return _add_or_update_file(parent, file_id, file_path, name, tags, settings, update_callback, "update")
 
-def delete_files_from_catalog(file_ids, file_names, settings, update_callback):
+def delete_files_from_catalog(parent, file_ids, file_names, settings, update_callback, done_callback=None):
     """
     Delete files from the catalog
     
+    The confirmation is asked on the UI thread and the delete runs on a worker thread.
+    
     Args:
+        parent: Parent window
         file_ids: List of file IDs to delete
         file_names: List of file names (for confirmation/success messages)
         settings: Settings dictionary
         update_callback: Callback to update UI after operation
+        done_callback: Optional callback run on the UI thread once the delete
+            finishes, whether or not it succeeded
         
     Returns:
-        bool: True if successful, False otherwise
+        Future: The pending operation, or None if nothing is deleted
     """
     if not file_ids:
-        return False
+        return None
     
     # Confirmation dialog if enabled
     if settings.get("confirm_delete", True):
@@ -199,30 +299,37 @@ def delete_files_from_catalog(file_ids, file_names, settings, update_callback):
             message = f"Are you sure you want to delete {len(file_ids)} selected items?"
             
         if not messagebox.askyesno("Confirm Delete", message):
-            return False
+            return None
     
-    # Delete from database
-    if DatabaseManager.delete_files(file_ids):
-        # Show success message if enabled
-        if settings.get("show_success_messages", True):
-            if len(file_ids) == 1:
-                messagebox.showinfo("Success", f"Deleted '{file_names[0]}' from catalog")
-            else:
-                messagebox.showinfo("Success", f"Deleted {len(file_ids)} items from catalog")
+    def finish(success):
+        if success:
+            # Show success message if enabled
+            if settings.get("show_success_messages", True):
+                if len(file_ids) == 1:
+                    messagebox.showinfo("Success", f"Deleted '{file_names[0]}' from catalog")
+                else:
+                    messagebox.showinfo("Success", f"Deleted {len(file_ids)} items from catalog")
+            
+            # Update UI
+            update_callback()
+        else:
+            messagebox.showerror("Error", "Failed to delete items from catalog")
         
-        # Update UI
-        update_callback()
-        return True
-    else:
-        messagebox.showerror("Error", "Failed to delete items from catalog")
-        return False
+        if done_callback is not None:
+            done_callback()
+    
+    # Delete from database
+    return run_in_background(parent, DatabaseManager.delete_files, (file_ids,), finish)
 
-def export_database():
+def export_database(parent):
     """
-    Export the database to a JSON file
+    Export the database to a JSON file on a worker thread
     
+    Args:
+        parent: Parent window
+        
     Returns:
-        str: Path to exported file, or None if canceled/failed
+        Future: The pending export, or None if canceled
     """
     export_path = filedialog.asksaveasfilename(
         title="Export Database",
@@ -233,22 +340,24 @@ def export_database():
     if not export_path:
         return None
         
-    if DatabaseManager.export_to_json(export_path):
-        messagebox.showinfo("Export Complete", f"Successfully exported database to {export_path}")
-        return export_path
-    else:
-        messagebox.showerror("Export Error", "Failed to export database")
-        return None
+    def finish(success):
+        if success:
+            messagebox.showinfo("Export Complete", f"Successfully exported database to {export_path}")
+        else:
+            messagebox.showerror("Export Error", "Failed to export database")
+    
+    return run_in_background(parent, DatabaseManager.export_to_json, (export_path,), finish)
 
-def import_database(update_callback):
+def import_database(parent, update_callback):
     """
-    Import data from a JSON file
+    Import data from a JSON file on a worker thread
     
     Args:
-        update_callback: Callback to update UI after operation
+        parent: Parent window
+        update_callback: Callback to update UI after a successful import
         
     Returns:
-        bool: True if successful, False otherwise
+        Future: The pending import, or None if canceled
     """
     import_path = filedialog.askopenfilename(
         title="Import Database",
@@ -256,7 +365,7 @@ def import_database(update_callback):
     )
     
     if not import_path:
-        return False
+        return None
         
     # Ask if user wants to merge or replace
     result = messagebox.askyesno(
@@ -266,13 +375,16 @@ def import_database(update_callback):
         "No = Replace (delete all existing entries)"
     )
     
+    def finish(success):
+        if success:
+            # Update UI
+            update_callback()
+            
+            messagebox.showinfo("Import Complete", "Successfully imported data")
+        else:
+            messagebox.showerror("Import Error", "Failed to import data")
+    
     # Import data
-    if DatabaseManager.import_from_json(import_path, replace=not result):
-        # Update UI
-        update_callback()
-        
-        messagebox.showinfo("Import Complete", "Successfully imported data")
-        return True
-    else:
-        messagebox.showerror("Import Error", "Failed to import data")
-        return False
\ No newline at end of file
+    return run_in_background(
+        parent, DatabaseManager.import_from_json, (import_path, not result), finish
+    )
\ No newline at end of file
@@ -5,131 +5,215 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 
 from app_config import save_settings
+from utils.geometry import install_geometry_saver
 
-def open_settings_dialog(parent, settings, export_callback, import_callback):
+# Delay before the shown geometry follows a move or resize of the main window
+GEOMETRY_UPDATE_DELAY_MS = 100
+
+class SettingsDialog:
     """
-    Open settings dialog
-    
-    Args:
-        parent: Parent window
-        settings: Settings dictionary
-        export_callback: Callback function for exporting database
-        import_callback: Callback function for importing database
+    Settings dialog that is built on first use and hidden, rather than destroyed,
+    when closed so reopening it is cheap
     """
-    settings_dialog = tk.Toplevel(parent)
-    settings_dialog.title("Settings")
-    
-    # Force a larger window size - increase height to make sure buttons are visible
-    settings_dialog.geometry("500x500")  # Increased from 450 to 500
-    settings_dialog.transient(parent)  # Make it modal
-    settings_dialog.grab_set()
-    settings_dialog.minsize(500, 500)  # Increase minimum size as well
-    
-    # Create settings content
-    content_frame = ttk.Frame(settings_dialog, padding=20)
-    content_frame.pack(fill=tk.BOTH, expand=True)
-    
-    ttk.Label(content_frame, text="Application Settings", font=("Arial", 14, "bold")).pack(pady=(0, 20))
-    
-    # Notification settings
-    notifications_frame = ttk.LabelFrame(content_frame, text="Notifications")
-    notifications_frame.pack(fill=tk.X, pady=10)
-    
-    # Success messages setting
-    show_success_var = tk.BooleanVar(value=settings.get("show_success_messages", True))
-    ttk.Checkbutton(
-        notifications_frame, 
-        text="Show success messages when adding/updating items", 
-        variable=show_success_var
-    ).pack(padx=10, pady=10, anchor="w")
     
-    # Confirmation dialog setting
-    confirm_delete_var = tk.BooleanVar(value=settings.get("confirm_delete", True))
-    ttk.Checkbutton(
-        notifications_frame, 
-        text="Show confirmation dialog when deleting items", 
-        variable=confirm_delete_var
-    ).pack(padx=10, pady=10, anchor="w")
-    
-    # Window settings
-    window_frame = ttk.LabelFrame(content_frame, text="Window")
-    window_frame.pack(fill=tk.X, pady=10)
-    
-    # Remember window geometry setting
-    remember_window_var = tk.BooleanVar(value=settings.get("remember_window_geometry", False))
-    ttk.Checkbutton(
-        window_frame,
-        text="Remember window size and position",
-        variable=remember_window_var
-    ).pack(padx=10, pady=10, anchor="w")
-    
-    # Display current window geometry info
-    current_geometry = parent.geometry()
-    ttk.Label(
-        window_frame,
-        text=f"Current window size and position: {current_geometry}"
-    ).pack(padx=10, pady=(0, 10), anchor="w")
-    
-    # Database maintenance section
-    db_frame = ttk.LabelFrame(content_frame, text="Database")
-    db_frame.pack(fill=tk.X, pady=10)
-    
-    db_buttons_frame = ttk.Frame(db_frame)
-    db_buttons_frame.pack(padx=10, pady=10, fill=tk.X)
+    def __init__(self, parent, settings, export_callback, import_callback):
+        """
+        Initialize the settings dialog without building it
+        
+        Args:
+            parent: Parent window
+            settings: Settings dictionary
+            export_callback: Callback function for exporting database
+            import_callback: Callback function for importing database
+        """
+        self.parent = parent
+        self.settings = settings
+        self.export_callback = export_callback
+        self.import_callback = import_callback
+        
+        self.top = None
+        self._built = False
+        self._geometry_job = None
+    
+    def open(self):
+        """Show the dialog, building it the first time"""
+        if not self._built or not self.top.winfo_exists():
+            self._build()
+        else:
+            self.top.deiconify()
+        
+        # Show the current settings every time the dialog opens
+        self._load_settings()
+        
+        self.top.lift()
+        self.top.grab_set()
     
-    ttk.Button(
-        db_buttons_frame,
-        text="Export Database",
-        command=export_callback,
-        width=20
-    ).pack(side=tk.LEFT, padx=10, pady=5)
+    def _build(self):
+        """Create the dialog window and its widgets"""
+        self.top = tk.Toplevel(self.parent)
+        self.top.title("Settings")
+        
+        # Force a larger window size - increase height to make sure buttons are visible
+        self.top.geometry("500x500")  # Increased from 450 to 500
+        self.top.transient(self.parent)  # Make it modal
+        self.top.minsize(500, 500)  # Increase minimum size as well
+        
+        # Closing the window only hides it
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Create settings content
+        content_frame = ttk.Frame(self.top, padding=20)
+        content_frame.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(content_frame, text="Application Settings", font=("Arial", 14, "bold")).pack(pady=(0, 20))
+        
+        # Notification settings
+        notifications_frame = ttk.LabelFrame(content_frame, text="Notifications")
+        notifications_frame.pack(fill=tk.X, pady=10)
+        
+        # Success messages setting
+        self.show_success_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            notifications_frame,
+            text="Show success messages when adding/updating items",
+            variable=self.show_success_var
+        ).pack(padx=10, pady=10, anchor="w")
+        
+        # Confirmation dialog setting
+        self.confirm_delete_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            notifications_frame,
+            text="Show confirmation dialog when deleting items",
+            variable=self.confirm_delete_var
+        ).pack(padx=10, pady=10, anchor="w")
+        
+        # Window settings
+        window_frame = ttk.LabelFrame(content_frame, text="Window")
+        window_frame.pack(fill=tk.X, pady=10)
+        
+        # Remember window geometry setting
+        self.remember_window_var = tk.BooleanVar()
+        ttk.Checkbutton(
+            window_frame,
+            text="Remember window size and position",
+            variable=self.remember_window_var
+        ).pack(padx=10, pady=10, anchor="w")
+        
+        # Display current window geometry info, kept up to date as the main window changes
+        self.geo_var = tk.StringVar()
+        geometry_frame = ttk.Frame(window_frame)
+        geometry_frame.pack(padx=10, pady=(0, 10), anchor="w")
+        ttk.Label(geometry_frame, text="Current window size and position:").pack(side=tk.LEFT)
+        ttk.Label(geometry_frame, textvariable=self.geo_var).pack(side=tk.LEFT, padx=(5, 0))
+        self.parent.bind('<Configure>', self._on_parent_configure, add='+')
+        
+        # Database maintenance section
+        db_frame = ttk.LabelFrame(content_frame, text="Database")
+        db_frame.pack(fill=tk.X, pady=10)
+        
+        db_buttons_frame = ttk.Frame(db_frame)
+        db_buttons_frame.pack(padx=10, pady=10, fill=tk.X)
+        
+        ttk.Button(
+            db_buttons_frame,
+            text="Export Database",
+            command=self.export_callback,
+            width=20
+        ).pack(side=tk.LEFT, padx=10, pady=5)
+        
+        ttk.Button(
+            db_buttons_frame,
+            text="Import Database",
+            command=self.import_callback,
+            width=20
+        ).pack(side=tk.LEFT, padx=10, pady=5)
+        
+        # Buttons frame at the bottom with clear separation
+        separator = ttk.Separator(content_frame, orient='horizontal')
+        separator.pack(fill=tk.X, pady=20)
+        
+        button_frame = ttk.Frame(content_frame)
+        button_frame.pack(fill=tk.X)
+        
+        # Save button (larger and more prominent)
+        save_button = ttk.Button(
+            button_frame,
+            text="Save Settings",
+            command=self.save_and_close,
+            width=15
+        )
+        save_button.pack(side=tk.RIGHT, padx=10)
+        
+        # Cancel button
+        ttk.Button(
+            button_frame,
+            text="Cancel",
+            command=self.close,
+            width=15
+        ).pack(side=tk.RIGHT, padx=10)
+        
+        self._built = True
     
-    ttk.Button(
-        db_buttons_frame,
-        text="Import Database",
-        command=import_callback,
-        width=20
-    ).pack(side=tk.LEFT, padx=10, pady=5)
+    def _load_settings(self):
+        """Reset the widgets from the settings dictionary"""
+        self.show_success_var.set(self.settings.get("show_success_messages", True))
+        self.confirm_delete_var.set(self.settings.get("confirm_delete", True))
+        self.remember_window_var.set(self.settings.get("remember_window_geometry", False))
+        
+        self.geo_var.set(self.parent.geometry())
     
-    # Buttons frame at the bottom with clear separation
-    separator = ttk.Separator(content_frame, orient='horizontal')
-    separator.pack(fill=tk.X, pady=20)
+    def _on_parent_configure(self, event):
+        """Schedule a geometry update when the main window itself moves or resizes"""
+        if event.widget is not self.parent or self._geometry_job is not None:
+            return
+        self._geometry_job = self.parent.after(GEOMETRY_UPDATE_DELAY_MS, self._update_geometry)
     
-    button_frame = ttk.Frame(content_frame)
-    button_frame.pack(fill=tk.X)
+    def _update_geometry(self):
+        """Show the main window's current geometry"""
+        self._geometry_job = None
+        self.geo_var.set(self.parent.geometry())
     
-    def save_and_close():
+    def save_and_close(self):
+        """Save the settings from the widgets and hide the dialog"""
         # Update settings
-        settings["show_success_messages"] = show_success_var.get()
-        settings["confirm_delete"] = confirm_delete_var.get()
-        settings["remember_window_geometry"] = remember_window_var.get()
+        self.settings["show_success_messages"] = self.show_success_var.get()
+        self.settings["confirm_delete"] = self.confirm_delete_var.get()
+        self.settings["remember_window_geometry"] = self.remember_window_var.get()
         
         # If remember window geometry is enabled, save current geometry
-        if remember_window_var.get():
-            settings["window_geometry"] = parent.geometry()
+        if self.remember_window_var.get():
+            self.settings["window_geometry"] = self.geo_var.get()
+        
+        # Start or stop tracking the main window's geometry
+        install_geometry_saver(self.parent, self.settings)
         
         # Save settings to file
-        save_settings(settings)
+        save_settings(self.settings)
         
         # Show confirmation
         messagebox.showinfo("Settings", "Settings saved successfully")
         
         # Close dialog
-        settings_dialog.destroy()
+        self.close()
     
-    # Save button (larger and more prominent)
-    save_button = ttk.Button(
-        button_frame, 
-        text="Save Settings",
-        command=save_and_close,
-        width=15
-    )
-    save_button.pack(side=tk.RIGHT, padx=10)
+    def close(self):
+        """Hide the dialog so it can be shown again without rebuilding"""
+        self.top.grab_release()
+        self.top.withdraw()
+
+def open_settings_dialog(parent, settings, export_callback, import_callback):
+    """
+    Open settings dialog
     
-    # Cancel button
-    ttk.Button(
-        button_frame, 
-        text="Cancel", 
-        command=settings_dialog.destroy,
-        width=15
-    ).pack(side=tk.RIGHT, padx=10)
\ No newline at end of file
+    Args:
+        parent: Parent window
+        settings: Settings dictionary
+        export_callback: Callback function for exporting database
+        import_callback: Callback function for importing database
+    
+    Returns:
+        SettingsDialog: The dialog, which can be reopened with open()
+    """
+    dialog = SettingsDialog(parent, settings, export_callback, import_callback)
+    dialog.open()
+    return dialog
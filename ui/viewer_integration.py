@@ -3,11 +3,86 @@ STL file viewer integration for STL Catalog
 """
 import os
 import sys
+import json
 import tkinter as tk
 from tkinter import messagebox
 import subprocess
 import importlib.util
+import functools
 
+from utils.viewer_process import send_to_viewer_process
+
+# Directory of this module; the viewer scripts live in its parent directory
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Viewer scripts found so far; failed lookups aren't cached so they are retried
+_script_cache = {}
+
+def _find_viewer_script(script_name, cwd_first=False):
+    """Find a viewer script in the usual locations
+    
+    Args:
+        script_name: File name of the viewer script
+        cwd_first: Look in the current directory first, then the package and
+            main script directories (the regular viewer's search order)
+        
+    Returns:
+        str: Path to the first existing candidate, or None if not found
+    """
+    # The current directory is part of the key, since it can change between calls
+    key = (script_name, os.getcwd() if cwd_first else None)
+    path = _script_cache.get(key)
+    if path is not None and os.path.exists(path):
+        return path
+    
+    if cwd_first:
+        candidates = (
+            os.path.join(os.getcwd(), script_name),
+            os.path.join(_SCRIPT_DIR, script_name),
+            os.path.join(os.path.dirname(_SCRIPT_DIR), script_name),
+            os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), script_name),
+        )
+    else:
+        candidates = (
+            os.path.join(os.path.dirname(_SCRIPT_DIR), script_name),
+            os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), script_name),
+            os.path.join(_SCRIPT_DIR, script_name),
+        )
+    
+    path = next((path for path in candidates if os.path.exists(path)), None)
+    if path is not None:
+        _script_cache[key] = path
+    return path
+
+# Settings for direct rendering in the standalone viewer, serialized once
+_DIRECT_RENDER_SETTINGS = {
+    'color': [120, 255, 150, 255],         # Light green color
+    'background_color': [0, 0, 0, 255],    # Black background
+    'show_axes': True,                     # Show coordinate axes
+    'rotation': [45, 45, 0],               # Default rotation for good view
+    'direct_render': True,                 # Flag to bypass metadata display
+    'zoom_factor': 1.5,                    # Zoom in by 50%
+}
+_SETTINGS_STR = json.dumps(_DIRECT_RENDER_SETTINGS)
+
+def _spawn_detached(cmd):
+    """
+    Start a one-off viewer process detached from this application
+    
+    The child gets its own session (or process group on Windows) and inherits no
+    open handles, so nothing ties its lifetime or resources to the catalog.
+    
+    Args:
+        cmd: Command line to run
+    """
+    kwargs = {}
+    if os.name == 'nt':
+        kwargs['creationflags'] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+    subprocess.Popen(cmd, close_fds=True, **kwargs)
+
+@functools.lru_cache(maxsize=1)
 def check_trimesh_available():
     """Check if Trimesh is available"""
     try:
@@ -17,6 +92,7 @@ def check_trimesh_available():
     except ImportError:
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_pyglet_version():
     """Check if Pyglet is available and has correct version"""
     try:
@@ -39,6 +115,10 @@ def install_dependencies():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "trimesh"])
         # Install Pyglet < 2.0
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyglet<2"])
+        
+        # Forget the cached results so the next check sees the new packages
+        check_trimesh_available.cache_clear()
+        check_pyglet_version.cache_clear()
         messagebox.showinfo(
             "Installation Complete", 
             "Dependencies have been installed successfully! Please restart the application."
@@ -84,6 +164,9 @@ def view_stl(parent, file_path):
     # Launch the viewer directly
     launch_viewer(parent, file_path)
 
+# Keys that may hold the file path in a details dictionary, in order of preference
+_PATH_KEYS = ('file_path', 'path', 'filepath', 'file', 'stl_path', 'location', 'full_path')
+
 def view_selected_stl(parent, file_path_or_details):
     """View the selected STL file - wrapper for view_stl to match expected function name
     
@@ -93,24 +176,16 @@ def view_selected_stl(parent, file_path_or_details):
     """
     # Extract the file path if a dictionary was provided
     if isinstance(file_path_or_details, dict):
-        # Direct key lookup with fallbacks
-        if 'file_path' in file_path_or_details:
-            file_path = file_path_or_details['file_path']
-        else:
-            # Check for common key names that might contain the file path
-            possible_keys = ['path', 'filepath', 'file', 'stl_path', 'location', 'full_path']
-            
-            file_path = None
-            # Try each possible key
-            for key in possible_keys:
-                if key in file_path_or_details and file_path_or_details[key]:
-                    file_path = file_path_or_details[key]
-                    break
-            
-            # If no path found, show error and exit
-            if not file_path:
-                messagebox.showerror("Error", "Could not determine the STL file path from the provided details.")
-                return
+        # Use the first common key name that holds a file path
+        file_path = next(
+            (file_path_or_details[key] for key in _PATH_KEYS if file_path_or_details.get(key)),
+            None
+        )
+        
+        # If no path found, show error and exit
+        if not file_path:
+            messagebox.showerror("Error", "Could not determine the STL file path from the provided details.")
+            return
     else:
         # If a string or PathLike object was provided, use it directly
         file_path = file_path_or_details
@@ -137,58 +212,17 @@ def launch_direct_viewer(stl_file_path):
         # Get the Python executable path
         python_exe = sys.executable
         
-        # First, try to find the standalone viewer which can be launched with settings
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        possible_standalone_paths = [
-            # Try these locations for standalone viewer
-            os.path.join(script_dir, "..", "enhanced_trimesh_viewer_standalone.py"),
-            os.path.join(os.path.dirname(script_dir), "enhanced_trimesh_viewer_standalone.py"),
-            os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "enhanced_trimesh_viewer_standalone.py"),
-            os.path.join(script_dir, "enhanced_trimesh_viewer_standalone.py"),
-        ]
-        
-        # Find the first existing standalone path
-        standalone_script = None
-        for path in possible_standalone_paths:
-            if os.path.exists(path):
-                standalone_script = path
-                print(f"Found standalone viewer script at: {path}")
-                break
+        # First, try the standalone viewer which can be launched with settings
+        standalone_script = _find_viewer_script("enhanced_trimesh_viewer_standalone.py")
         
         if standalone_script:
-            # Build the command with direct render settings
-            settings = {
-                'color': [120, 255, 150, 255],         # Light green color
-                'background_color': [0, 0, 0, 255],    # Black background
-                'show_axes': True,                     # Show coordinate axes
-                'rotation': [45, 45, 0],               # Default rotation for good view
-                'direct_render': True,                 # Flag to bypass metadata display
-                'zoom_factor': 1.5,                    # Zoom in by 50%
-            }
-            
-            import json
-            settings_str = json.dumps(settings)
-            
-            # Launch the standalone viewer with settings
+            # Launch the standalone viewer with the pre-serialized direct render settings
             print(f"Launching direct render: {python_exe} {standalone_script} {stl_file_path}")
-            subprocess.Popen([python_exe, standalone_script, stl_file_path, settings_str])
+            _spawn_detached([python_exe, standalone_script, stl_file_path, _SETTINGS_STR])
             return True
         
         # Fallback to regular viewer if standalone not found
-        possible_regular_paths = [
-            os.path.join(script_dir, "..", "enhanced_trimesh_viewer.py"),
-            os.path.join(os.path.dirname(script_dir), "enhanced_trimesh_viewer.py"),
-            os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "enhanced_trimesh_viewer.py"),
-            os.path.join(script_dir, "enhanced_trimesh_viewer.py"),
-        ]
-        
-        # Find the first existing regular path
-        regular_script = None
-        for path in possible_regular_paths:
-            if os.path.exists(path):
-                regular_script = path
-                print(f"Found regular viewer script at: {path}")
-                break
+        regular_script = _find_viewer_script("enhanced_trimesh_viewer.py")
         
         if not regular_script:
             messagebox.showerror("Error", "Could not find any viewer script")
@@ -196,7 +230,7 @@ def launch_direct_viewer(stl_file_path):
         
         # Launch regular viewer as fallback
         print(f"Launching regular viewer: {python_exe} {regular_script} {stl_file_path}")
-        subprocess.Popen([python_exe, regular_script, stl_file_path])
+        _spawn_detached([python_exe, regular_script, stl_file_path])
         return True
         
     except Exception as e:
@@ -210,33 +244,15 @@ def launch_viewer(parent, file_path):
         # Get the Python executable path
         python_exe = sys.executable
         
-        # Find the path to the viewer module
-        possible_paths = []
-        
-        # Current directory
-        possible_paths.append(os.path.join(os.getcwd(), "enhanced_trimesh_viewer.py"))
-        
-        # Script directory
-        possible_paths.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "enhanced_trimesh_viewer.py"))
-        
-        # Parent directory of script
-        possible_paths.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "enhanced_trimesh_viewer.py"))
-        
-        # Directory of the main script
-        possible_paths.append(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), "enhanced_trimesh_viewer.py"))
-        
-        # Find the first existing path
-        viewer_script = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                viewer_script = path
-                break
+        # Find the path to the viewer module, starting with the current directory
+        viewer_script = _find_viewer_script("enhanced_trimesh_viewer.py", cwd_first=True)
         
         if not viewer_script:
             raise FileNotFoundError("Could not find enhanced_trimesh_viewer.py")
         
-        # Create and launch the command
-        cmd = [python_exe, viewer_script, file_path]
+        # Without a parent window (command line use) launch a one-off viewer;
+        # the application keeps one viewer process alive and sends it each file
+        cmd = [python_exe, viewer_script, file_path if not parent else "--interactive"]
         
         # To properly handle Tkinter parent windows, we need to know if this is a module the viewer requires
         # If it's a module, we'll pass the parent window's ID
@@ -249,7 +265,10 @@ def launch_viewer(parent, file_path):
                 cmd.append(str(window_id))
             
         # Launch the viewer in a separate process to avoid threading issues
-        subprocess.Popen(cmd)
+        if parent:
+            send_to_viewer_process(cmd, file_path)
+        else:
+            _spawn_detached(cmd)
         
         return True
         
@@ -3,42 +3,292 @@ Window geometry utilities for STL Catalog application
 """
 import tkinter as tk
 import logging
+import os
+import re
+import sys
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 
-def apply_window_geometry(window, geometry_str=None, default_geometry="800x600"):
+from app_config import GEOMETRY_FILE
+
+_log = logging.getLogger(__name__)
+
+# Tk geometry strings: "WIDTHxHEIGHT", "+X+Y" (offsets may be negative, e.g. "+-34") or both
+_GEOM_RE = re.compile(r'(?:(\d+)x(\d+))?(?:([+-]-?\d+)([+-]-?\d+))?')
+
+def _normalize_geometry(geometry_str):
+    """
+    Validate a geometry string without calling into Tk, recovering it if possible
+    
+    Args:
+        geometry_str: Geometry string to check
+        
+    Returns:
+        str: A valid geometry string, or None if it couldn't be recovered
+    """
+    if _GEOM_RE.fullmatch(geometry_str):
+        return geometry_str
+    
+    # Try to recover the numbers from a mangled string
+    numbers = re.findall(r"-?\d+", geometry_str)
+    if len(numbers) == 4 and not numbers[0].startswith('-') and not numbers[1].startswith('-'):
+        recovered = f"{numbers[0]}x{numbers[1]}+{numbers[2]}+{numbers[3]}"
+    elif len(numbers) == 2 and not numbers[0].startswith('-') and not numbers[1].startswith('-'):
+        recovered = f"{numbers[0]}x{numbers[1]}"
+    else:
+        _log.warning("Ignoring invalid window geometry: %r", geometry_str)
+        return None
+    
+    _log.warning("Recovered window geometry %r from %r", recovered, geometry_str)
+    return recovered
+
+@lru_cache(maxsize=16)
+def _parse_size(size_str):
+    """
+    Parse a "WIDTHxHEIGHT" string
+    
+    Args:
+        size_str: Size string to parse
+        
+    Returns:
+        tuple: (width, height) as integers
+    """
+    width, height = size_str.split('x')
+    return int(width), int(height)
+
+def load_persisted_geometry(path):
+    """
+    Load a geometry string written by persist_geometry
+    
+    Args:
+        path: Path of the geometry file
+        
+    Returns:
+        str: The stored geometry, or None if missing or invalid
+    """
+    try:
+        with open(path, 'r') as f:
+            geometry_str = f.read(64).strip()
+    except OSError:
+        return None
+    
+    if geometry_str and _GEOM_RE.fullmatch(geometry_str):
+        return geometry_str
+    return None
+
+def persist_geometry(path, geometry_str):
+    """
+    Atomically write a geometry string to its own file
+    
+    Args:
+        path: Path of the geometry file
+        geometry_str: Geometry string to store
+        
+    Returns:
+        bool: True if written successfully, False otherwise
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(geometry_str + "\n")
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        _log.exception("Error persisting window geometry")
+        return False
+
+# Geometry from the last session, read once so it survives without a settings save
+_persisted_geometry = load_persisted_geometry(GEOMETRY_FILE)
+
+# Screen size per window, dropped again when the window is reconfigured
+_screen_cache = WeakKeyDictionary()
+
+def _invalidate_screen_size(event, window):
+    """Forget the cached screen size when the window itself is reconfigured"""
+    if event.widget is window:
+        _screen_cache.pop(window, None)
+
+def _get_screen_size(window):
+    """
+    Get the virtual root size for a window (the screen size when there is no
+    virtual root), querying Tk only when it isn't cached
+    
+    Args:
+        window: The tkinter window on the screen
+        
+    Returns:
+        tuple: (width, height) of the screen
+    """
+    size = _screen_cache.get(window)
+    if size is None:
+        size = (window.winfo_vrootwidth() or window.winfo_screenwidth(),
+                window.winfo_vrootheight() or window.winfo_screenheight())
+        _screen_cache[window] = size
+        
+        # Invalidate on <Configure> (e.g. moved to another monitor), binding only once
+        if not getattr(window, "_screen_cache_bound", False):
+            window.bind("<Configure>", lambda e: _invalidate_screen_size(e, window), add="+")
+            window._screen_cache_bound = True
+    return size
+
+def apply_window_geometry(window, geometry_str=None, default_geometry=(800, 600)):
     """
     Apply window geometry to a tkinter window
     
     Args:
         window: The tkinter window to apply geometry to
-        geometry_str: The geometry string to apply (format: "WIDTHxHEIGHT+X+Y")
-        default_geometry: Default geometry to use if geometry_str is None or invalid
+        geometry_str: The geometry string to apply (format: "WIDTHxHEIGHT+X+Y");
+            defaults to the geometry persisted from the last session
+        default_geometry: Default (width, height) to use if geometry_str is None or invalid;
+            a "WIDTHxHEIGHT" string is also accepted
     """
+    if not geometry_str:
+        geometry_str = _persisted_geometry
+    
+    # Invalid geometry falls back to the centered default without a Tk round trip
+    if geometry_str:
+        geometry_str = _normalize_geometry(geometry_str)
+    
     # If no geometry string provided, center the window with default size
     if not geometry_str:
         # Get screen dimensions
-        screen_width = window.winfo_screenwidth()
-        screen_height = window.winfo_screenheight()
+        screen_width, screen_height = _get_screen_size(window)
         
-        # Parse default geometry
-        parts = default_geometry.split('x')
-        width = int(parts[0])
-        height = int(parts[1])
+        # Default size, parsing strings only once
+        if isinstance(default_geometry, str):
+            width, height = _parse_size(default_geometry)
+        else:
+            width, height = default_geometry
         
-        # Calculate position
-        x = (screen_width - width) // 2
-        y = (screen_height - height) // 2
+        # Calculate position, keeping the top-left corner on screen
+        x = max(0, (screen_width - width) // 2)
+        y = max(0, (screen_height - height) // 2)
         
         # Apply centered default geometry
         window.geometry(f"{width}x{height}+{x}+{y}")
         return
     
+    # Apply custom geometry
+    window.geometry(geometry_str)
+
+# Windows with a geometry save already scheduled for the next idle slot
+_pending = set()
+
+def _flush(window, settings):
+    """
+    Write the window's current geometry to settings
+    
+    Args:
+        window: The tkinter window to get geometry from
+        settings: The settings dictionary to save to
+        
+    Returns:
+        bool: True if saved successfully, False otherwise
+    """
+    _pending.discard(id(window))
+    try:
+        # Get current geometry
+        current_geometry = window.geometry()
+        
+        # Save to settings
+        settings["window_geometry"] = current_geometry
+        return True
+    except Exception:
+        _log.exception("Error saving window geometry")
+        return False
+
+# Quiet period after the last move or resize before the geometry file is rewritten
+PERSIST_DELAY_MS = 500
+
+def _persist(geometry_str):
+    """Write the geometry file, skipping the write when nothing moved"""
+    global _persisted_geometry
+    
+    if geometry_str != _persisted_geometry:
+        _persisted_geometry = geometry_str
+        persist_geometry(GEOMETRY_FILE, geometry_str)
+
+def _schedule_persist(window, settings):
+    """(Re)start the timer that writes the saved geometry to the geometry file"""
+    job = getattr(window, "_persist_job", None)
+    if job is not None:
+        window.after_cancel(job)
+    window._persist_job = window.after(PERSIST_DELAY_MS, _persist_saved, window, settings)
+
+def _persist_saved(window, settings):
+    """Write the geometry last saved to settings to the geometry file"""
+    window._persist_job = None
+    _persist(settings["window_geometry"])
+
+def _schedule_flush(window, settings):
+    """
+    Save the window's geometry when Tk is next idle, once per burst of calls
+    
+    Args:
+        window: The tkinter window to get geometry from
+        settings: The settings dictionary to save to
+    """
+    # A save is already scheduled for this window
+    if id(window) in _pending:
+        return
+    
+    _pending.add(id(window))
+    window.after_idle(_flush_unless_maximized, window, settings)
+
+def is_window_maximized(window):
+    """
+    Check whether a window is maximized, using the platform's approach
+    
+    Args:
+        window: The tkinter window to check
+        
+    Returns:
+        bool: True if the window is maximized (or fullscreen), False otherwise
+    """
+    if sys.platform == "win32":
+        # Windows-specific approach
+        return window.wm_state() == 'zoomed'
+    
+    # Linux/macOS approach - safely check if the attribute exists
     try:
-        # Apply custom geometry
-        window.geometry(geometry_str)
-    except Exception as e:
-        logging.error(f"Error applying window geometry: {e}")
-        # Fallback to default if there's an error
-        window.geometry(default_geometry)
+        return bool(window.attributes('-zoomed'))
+    except tk.TclError:
+        # Attribute not supported, try alternative method
+        try:
+            return bool(window.attributes('-fullscreen'))
+        except tk.TclError:
+            # Neither attribute works, default to False
+            return False
+
+def _flush_unless_maximized(window, settings):
+    """Save the geometry, keeping the restored geometry while the window is maximized"""
+    _pending.discard(id(window))
+    if not is_window_maximized(window) and _flush(window, settings):
+        # The file is only written once the window has stopped moving
+        _schedule_persist(window, settings)
+
+def _on_configure(event, window, settings):
+    """Save the geometry when the window itself moves or resizes"""
+    if window._save_geometry and event.widget is window:
+        _schedule_flush(window, settings)
+
+def install_geometry_saver(window, settings):
+    """
+    Keep settings in step with the window's geometry as it moves or resizes
+    
+    The "remember_window_geometry" setting is read here rather than on every
+    event, so call this again whenever that setting changes.
+    
+    Args:
+        window: The tkinter window to track
+        settings: The settings dictionary to save to
+    """
+    window._save_geometry = bool(settings.get("remember_window_geometry", False))
+    
+    # Bind only once; with the setting off the handler is a no-op
+    if not getattr(window, "_geometry_saver_bound", False):
+        window.bind("<Configure>", lambda e: _on_configure(e, window, settings), add="+")
+        window._geometry_saver_bound = True
 
 def save_window_geometry(window, settings):
     """
@@ -51,16 +301,17 @@ def save_window_geometry(window, settings):
     Returns:
         bool: True if saved successfully, False otherwise
     """
-    if settings.get("remember_window_geometry", False):
-        try:
-            # Get current geometry
-            current_geometry = window.geometry()
-            
-            # Save to settings
-            settings["window_geometry"] = current_geometry
-            return True
-        except Exception as e:
-            logging.error(f"Error saving window geometry: {e}")
-            return False
+    # Only saves for windows with the saver installed and enabled
+    if not getattr(window, "_save_geometry", False):
+        return False
+    
+    # Write the geometry file now rather than when a pending timer fires
+    job = getattr(window, "_persist_job", None)
+    if job is not None:
+        window.after_cancel(job)
+        window._persist_job = None
     
-    return False
\ No newline at end of file
+    if not _flush(window, settings):
+        return False
+    _persist(settings["window_geometry"])
+    return True
@@ -0,0 +1,81 @@
+"""
+Long-lived viewer processes for STL Catalog application
+
+A viewer started with --interactive reads one STL file path per line on stdin
+and opens each in a new window, so repeated views skip the interpreter and
+Trimesh start-up cost of a fresh process.
+"""
+import os
+import sys
+import atexit
+import subprocess
+
+# Running viewer processes, keyed by the command that started them
+_viewer_procs = {}
+
+def send_to_viewer_process(cmd, file_path):
+    """
+    Show a file in the viewer process started by cmd, starting it if needed
+    
+    Args:
+        cmd: Command that starts the viewer in --interactive mode
+        file_path: Path to the STL file
+    
+    Raises:
+        OSError: If the viewer could not be started or sent the path
+    """
+    key = tuple(cmd)
+    
+    for _ in range(2):
+        proc = _viewer_procs.get(key)
+        if proc is None or proc.poll() is not None:
+            # Own session/process group, so the viewer isn't signalled along with the catalog
+            kwargs = {}
+            if os.name == 'nt':
+                kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+            else:
+                kwargs['start_new_session'] = True
+            proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, universal_newlines=True, **kwargs)
+            _viewer_procs[key] = proc
+        
+        try:
+            proc.stdin.write(file_path + "\n")
+            proc.stdin.flush()
+            return
+        except OSError:
+            # The viewer went away between the poll and the write; start a new one
+            _viewer_procs.pop(key, None)
+    
+    raise OSError("Could not send the file to the viewer process")
+
+def stop_viewer_processes():
+    """
+    Close the input of every viewer process started by this application
+    
+    Each viewer then exits once its open windows are closed, so viewers stay
+    open after the catalog itself exits.
+    """
+    for proc in _viewer_procs.values():
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+    _viewer_procs.clear()
+
+atexit.register(stop_viewer_processes)
+
+def read_viewer_paths(paths):
+    """
+    Queue each file path read from stdin, then None once stdin is closed
+    
+    Runs on a reader thread in the viewer process so its window loop never
+    blocks waiting for the next path.
+    
+    Args:
+        paths: queue.Queue to put the paths on
+    """
+    for line in sys.stdin:
+        stl_file = line.strip()
+        if stl_file:
+            paths.put(stl_file)
+    paths.put(None)